@@ -0,0 +1,107 @@
+import gzip
+import json
+import os
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+
+import requests
+
+import asset_cache
+from storage import atomic_write
+
+# Lottie animation URLs
+LOTTIE_GARDEN = "https://lottie.host/4c8d8c8e-3a4a-4b8e-9c8e-8a8c8e8c8e8c/8K8c8e8c8e.json"
+LOTTIE_PLANT = "https://assets2.lottiefiles.com/packages/lf20_bqjqthsp.json"
+LOTTIE_WATERING = "https://assets9.lottiefiles.com/packages/lf20_wd1udlcz.json"
+LOTTIE_CHAT = "https://assets4.lottiefiles.com/packages/lf20_ztevr5mt.json"
+LOTTIE_SUCCESS = "https://assets9.lottiefiles.com/packages/lf20_rovf9gzu.json"
+
+BUNDLED_URLS = [LOTTIE_GARDEN, LOTTIE_PLANT, LOTTIE_WATERING, LOTTIE_CHAT, LOTTIE_SUCCESS]
+
+# Offline asset pack produced by `python animations.py build`
+PACK_PATH = os.getenv("LOTTIE_PACK_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "assets", "lottie_pack.json.gz"
+)
+
+_pack = None
+_pack_lock = threading.Lock()
+
+# Background fetchers shared by all sessions
+_executor = ThreadPoolExecutor(max_workers=int(os.getenv("LOTTIE_FETCH_WORKERS", "4")),
+                               thread_name_prefix="lottie-fetch")
+
+# Parse the bundled pack once per process; the result is shared by every
+# session, so callers must treat the animation objects as read-only
+def preload():
+    global _pack
+    if _pack is None:
+        with _pack_lock:
+            if _pack is None:
+                _pack = MappingProxyType(_read_pack(PACK_PATH))
+    return _pack
+
+def _read_pack(path):
+    try:
+        with gzip.open(path, "rb") as f:
+            pack = json.load(f)
+        return dict(pack.get("assets", {}))
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+# Load an animation from the bundled pack, falling back to the remote cache
+def load(url):
+    asset = preload().get(url)
+    if asset is not None:
+        return asset
+    return asset_cache.get_json(url)
+
+# Start loading an animation without blocking; returns a Future that is
+# already resolved when the asset is bundled or cached in memory
+def load_async(url):
+    asset = preload().get(url)
+    if asset is None:
+        asset = asset_cache.peek(url)
+    if asset is None:
+        return _executor.submit(load, url)
+    future = Future()
+    future.set_result(asset)
+    return future
+
+# Download the bundled animations and write them into a gzip asset pack.
+# Animations that fail to download keep their copy from the previous pack,
+# so a rebuild during an outage never loses assets.
+def build_pack(urls=BUNDLED_URLS, path=PACK_PATH):
+    previous = _read_pack(path)
+    assets = {}
+    missing = []
+    for url in urls:
+        try:
+            r = requests.get(url, timeout=asset_cache.REQUEST_TIMEOUT)
+            if r.status_code != 200:
+                raise ValueError(f"HTTP {r.status_code}")
+            assets[url] = r.json()
+        except Exception as e:
+            missing.append((url, e))
+            if url in previous:
+                assets[url] = previous[url]
+    if not assets:
+        return assets, missing
+    payload = {"version": 1, "assets": assets}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # mtime=0 keeps the archive byte-identical when the animations don't change
+    data = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    atomic_write(path, gzip.compress(data, mtime=0))
+    return assets, missing
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["build"]:
+        print("usage: python animations.py build")
+        sys.exit(2)
+    assets, missing = build_pack()
+    print(f"Packed {len(assets)} animation(s) into {PACK_PATH}")
+    for url, error in missing:
+        kept = "kept the previous copy" if url in assets else "skipped"
+        print(f"  {kept} {url}: {error}")
+    sys.exit(0 if assets else 1)
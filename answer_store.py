@@ -0,0 +1,153 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from response_cache import normalize
+from storage import atomic_write
+
+# Precomputed answers, one gzip file per model, built by `python answer_store.py build`
+STORE_DIR = os.getenv("ANSWER_STORE_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "assets", "answers"
+)
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+def store_path(model_name):
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+    return os.path.join(STORE_DIR, f"{slug}.json.gz")
+
+def catalog_hash(questions):
+    return hashlib.sha256("\n".join(questions).encode("utf-8")).hexdigest()[:12]
+
+def _read_store(path):
+    try:
+        with gzip.open(path, "rb") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"answers": {}}
+
+# Parsed store for a model, loaded once per process and shared read-only
+def load_store(model_name):
+    store = _stores.get(model_name)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(model_name)
+            if store is None:
+                store = _read_store(store_path(model_name))
+                _stores[model_name] = store
+    return store
+
+# Precomputed answer for a question, or None when the store doesn't have it
+def lookup(question, model_name):
+    entry = load_store(model_name)["answers"].get(normalize(question))
+    return entry["answer"] if entry else None
+
+def write_store(model_name, answers, questions, version):
+    store = {
+        "model": model_name,
+        "version": version,
+        "catalog": catalog_hash(questions),
+        "built_at": datetime.utcnow().isoformat(),
+        "answers": answers,
+    }
+    os.makedirs(STORE_DIR, exist_ok=True)
+    data = json.dumps(store, ensure_ascii=False, sort_keys=True, indent=1).encode("utf-8")
+    atomic_write(store_path(model_name), gzip.compress(data, mtime=0))
+    with _stores_lock:
+        _stores.pop(model_name, None)
+    return store
+
+
+# Paces the generation workers to one request every 60/per_minute seconds
+class RateLimiter:
+    def __init__(self, per_minute):
+        self.interval = 60.0 / per_minute
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        time.sleep(max(0.0, slot - now))
+
+
+def _generate(model, question, limiter, retries=3):
+    for attempt in range(retries):
+        limiter.wait()
+        try:
+            return model.generate_content(question).text
+        except Exception:
+            if attempt == retries - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+# Generate answers for every question missing from the model's store. Work is
+# submitted in batches to a small worker pool and paced by a shared rate limit;
+# each finished batch is written out so an interrupted build keeps its progress.
+def build_store(model, model_name, questions, concurrency=4, per_minute=30, batch_size=10,
+                rebuild=False, log=print):
+    previous = load_store(model_name)
+    answers = dict(previous["answers"])
+    if rebuild:
+        # Regenerate everything, but keep the old answer of any question that
+        # fails; answers to questions no longer in the catalog are dropped
+        current = {normalize(q) for q in questions}
+        answers = {key: entry for key, entry in answers.items() if key in current}
+    version = previous.get("version", 0) + 1
+    pending = list(questions) if rebuild else [q for q in questions if normalize(q) not in answers]
+    limiter = RateLimiter(per_minute)
+    failed = []
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="answer-build") as pool:
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            futures = [(q, pool.submit(_generate, model, q, limiter)) for q in batch]
+            for question, future in futures:
+                try:
+                    answers[normalize(question)] = {"question": question, "answer": future.result()}
+                    log(f"  answered: {question}")
+                except Exception as e:
+                    failed.append(question)
+                    log(f"  failed: {question} ({e})")
+            write_store(model_name, answers, questions, version)
+    return len(pending) - len(failed), failed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the precomputed answer store for the Prompts page")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--model", default=None, help="Gemini model name (defaults to GEMINI_MODEL)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--per-minute", type=int, default=30, help="maximum generation requests per minute")
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--rebuild", action="store_true", help="regenerate answers that already exist")
+    args = parser.parse_args()
+
+    from dotenv import load_dotenv
+
+    import gemini
+    from prompt_catalog import all_prompts
+
+    load_dotenv()
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        print("GEMINI_API_KEY is not set")
+        sys.exit(1)
+    model_name = args.model or gemini.DEFAULT_MODEL
+    generated, failed = build_store(
+        gemini.get_model(api_key, model_name), model_name, all_prompts(),
+        concurrency=args.concurrency, per_minute=args.per_minute,
+        batch_size=args.batch_size, rebuild=args.rebuild,
+    )
+    store = load_store(model_name)
+    print(f"Generated {generated} answer(s); {store_path(model_name)} is at version {store.get('version')}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,71 @@
+import importlib
+import threading
+
+# Page registry. Pages are listed by module path only; a page's module is
+# imported the first time anyone navigates to it and then shared by every
+# session in the process, so opening one page never loads the others.
+# Each page module has a render() function and may declare RESOURCES, the
+# shared resources it relies on, which are warmed up in the background the
+# first time the page loads.
+PAGES = {
+    "Home": "app_pages.home",
+    "Chatbot": "app_pages.chatbot",
+    "Prompts": "app_pages.prompts",
+    "Forum": "app_pages.forum",
+    "Contact": "app_pages.contact",
+    "Order": "app_pages.order",
+    "Checkout": "app_pages.checkout",
+}
+LOGIN_PAGE = "app_pages.login"
+
+# Resource name -> "module" to import or "module:function" to call
+RESOURCE_LOADERS = {
+    "gemini": "services:warm_up_gemini",
+    "speech": "transcription",
+    "response_cache": "response_cache:get_cache",
+    "answers": "services:load_answer_store",
+    "forum": "services:open_local_forum",
+    "forum_events": "forum_events:get_hub",
+    "catalog": "services:get_catalog",
+    "write_queue": "services:get_write_queue",
+}
+
+_loaded = {}
+_prepared = set()
+_lock = threading.Lock()
+
+# The page module at `path`, imported once per process
+def load(path):
+    module = _loaded.get(path)
+    if module is None:
+        with _lock:
+            module = _loaded.get(path)
+            if module is None:
+                module = importlib.import_module(path)
+                _loaded[path] = module
+        prepare(getattr(module, "RESOURCES", ()))
+    return module
+
+def page_names():
+    return list(PAGES)
+
+def render(name):
+    load(PAGES[name]).render()
+
+# Warm up resources on a daemon thread; each one only once per process
+def prepare(resources):
+    with _lock:
+        pending = [name for name in resources if name not in _prepared]
+        _prepared.update(pending)
+    if pending:
+        threading.Thread(target=_load_resources, args=(pending,), name="page-resources", daemon=True).start()
+
+def _load_resources(resources):
+    for name in resources:
+        module_name, _, function = RESOURCE_LOADERS[name].partition(":")
+        try:
+            module = importlib.import_module(module_name)
+            if function:
+                getattr(module, function)()
+        except Exception:
+            pass
@@ -0,0 +1,97 @@
+import streamlit as st
+
+import chat_context
+from animations import LOTTIE_CHAT, LOTTIE_SUCCESS
+from app_state import save_server_value, server_value
+from chat_ui import answer_question, process_audio, record_chat_turn
+from services import setup_gemini
+from ui import lottie_slot
+
+RESOURCES = ("gemini", "speech", "response_cache")
+
+# Chatbot Page Content
+def render():
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.title("🤖 Gardening Assistant Chatbot")
+        st.markdown("Ask anything about **RoofTop gardening** and get instant responses powered by **Gemini Flash 2 AI**!")
+    with col2:
+        lottie_slot(LOTTIE_CHAT, height=200, key="chatbot_anim")
+    
+    # Conversation so far
+    history = server_value("chat_history")
+    if history["summary"]:
+        st.caption("🗂️ Earlier messages have been summarized to keep the conversation light.")
+    for turn in history["turns"]:
+        with st.chat_message("user" if turn["role"] == "user" else "assistant"):
+            st.markdown(turn["text"] if turn["role"] == "user" else f"**{turn['text']}**")
+
+    # Any interaction while streaming (including Stop) interrupts the run
+    if st.session_state.get("partial_response"):
+        st.subheader("🤖 AI Response (stopped):")
+        st.markdown(f"**{st.session_state.partial_response}**")
+        st.session_state.partial_response = None
+
+    try:
+        model = setup_gemini()
+        if model:
+            input_method = st.radio("Choose input method:", ["Text", "Audio"])
+            user_input = ""
+            
+            if input_method == "Text":
+                user_input = st.text_area("Type your question here...", height=100)
+            else:
+                st.write("### 🎤 Upload Audio")
+                audio_file = st.file_uploader("Upload an audio file to ask your question", type=["mp3", "wav", "ogg"])
+                
+                if audio_file is not None:
+                    st.audio(audio_file, format="audio/*")
+                    # The transcript survives reruns, so "Generate Response" can use it
+                    upload_id = getattr(audio_file, "file_id", None) or f"{audio_file.name}:{audio_file.size}"
+                    transcript = server_value("transcript")
+                    if transcript and transcript["upload_id"] != upload_id:
+                        transcript = None
+                        save_server_value("transcript", None)
+                    if st.button("Transcribe Audio"):
+                        with st.spinner("Transcribing audio..."):
+                            result = process_audio(audio_file)
+                            if result:
+                                transcript = dict(result, upload_id=upload_id)
+                                save_server_value("transcript", transcript)
+                                st.success("Transcription successful!")
+                            else:
+                                st.error("Could not transcribe audio. Please try again.")
+                    if transcript:
+                        user_input = transcript["text"]
+                        st.write(f"Your question: {user_input}")
+                        if transcript.get("confidence") is not None:
+                            st.caption(f"Confidence: {transcript['confidence']:.0%} · Language: {transcript['language']}")
+            
+            col_generate, col_clear = st.columns([3, 1])
+            with col_clear:
+                if st.button("🧹 New conversation", use_container_width=True):
+                    save_server_value("chat_history", chat_context.new_history())
+                    st.rerun()
+            with col_generate:
+                generate = st.button("Generate Response 🌿")
+            if generate:
+                if user_input:
+                    try:
+                        with st.chat_message("user"):
+                            st.markdown(user_input)
+                        with st.chat_message("assistant"):
+                            answer = answer_question(model, user_input, history)
+                        record_chat_turn(model, history, user_input, answer)
+                        save_server_value("chat_history", history)
+                        
+                        # Show success animation
+                        lottie_slot(LOTTIE_SUCCESS, height=100, key="success_anim")
+                    except Exception as e:
+                        st.session_state.partial_response = None
+                        st.error(f"⚠️ Error: Could not process your request. {e}")
+                else:
+                    st.warning("⚠️ Please enter a question before submitting.")
+        else:
+            st.warning("⚠️ API key not configured. Please set up your API key to use the chatbot.")
+    except Exception as e:
+        st.error(f"⚠️ Error initializing the Chatbot: {e}. Please ensure your Gemini API key is correctly set.")
@@ -0,0 +1,66 @@
+import uuid
+from datetime import datetime
+
+import streamlit as st
+
+import order_store
+from animations import LOTTIE_SUCCESS
+from cart import cart_total, clear_cart, get_cart
+from services import get_write_queue, supabase_settings
+from ui import lottie_slot
+
+RESOURCES = ("write_queue",)
+
+# Checkout Page Content
+def render():
+    st.title("✅ Checkout")
+    cart = get_cart()
+    if not cart:
+        st.info("Your cart is empty. Add items from the Order page.")
+        return
+
+    st.subheader("Order Summary")
+    for ci in cart.values():
+        st.write(f"- {ci['name']} × {ci['quantity']} — ${ci['price']*ci['quantity']:.2f}")
+    total = cart_total()
+    st.write(f"**Total: ${total:.2f}**")
+
+    st.subheader("Shipping Details")
+    customer_name = st.text_input("Full Name")
+    email = st.text_input("Email")
+    address = st.text_area("Address", height=100)
+    place_order = st.button("Place Order")
+
+    if place_order:
+        if not customer_name or not email or not address:
+            st.warning("Please fill in all details.")
+            return
+        local_orders = order_store.ORDER_BACKEND == "sqlite"
+        if not local_orders and not supabase_settings()[0]:
+            st.error("Supabase is not configured. Set SUPABASE_URL and SUPABASE_ANON_KEY.")
+            return
+        try:
+            order_payload = {
+                "customer_name": customer_name,
+                "email": email,
+                "address": address,
+                "total": float(f"{total:.2f}"),
+                "created_at": datetime.utcnow().isoformat()
+            }
+            items_payload = [
+                {"product_id": ci["id"], "product_name": ci["name"], "unit_price": ci["price"], "quantity": ci["quantity"]}
+                for ci in cart.values()
+            ]
+            if local_orders:
+                order_id = order_store.get_local_store().place_order(order_payload, items_payload, uuid.uuid4().hex)
+                st.success(f"Order placed successfully! Order ID: {order_id}")
+            else:
+                order_ref = get_write_queue().enqueue("orders", {"order": order_payload, "items": items_payload})
+                st.success(f"Order placed successfully! Order reference: {order_ref[:8].upper()}")
+            
+            # Show success animation
+            lottie_slot(LOTTIE_SUCCESS, height=200, key="checkout_success")
+            
+            clear_cart()
+        except Exception as e:
+            st.error(f"Could not place order: {e}")
@@ -0,0 +1,45 @@
+import uuid
+from datetime import datetime
+
+import streamlit as st
+
+from animations import LOTTIE_PLANT, LOTTIE_SUCCESS
+from services import get_write_queue, supabase_settings
+from ui import lottie_slot
+
+RESOURCES = ("write_queue",)
+
+# Contact Page Content
+def render():
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.title("📬 Contact Us")
+        st.markdown("We'd love to hear from you. Send us your questions or feedback.")
+    with col2:
+        lottie_slot(LOTTIE_PLANT, height=200, key="contact_plant")
+    
+    name = st.text_input("Your Name")
+    email = st.text_input("Email")
+    message = st.text_area("Message", height=150)
+    submitted = st.button("Send Message")
+    
+    if submitted:
+        if not name or not email or not message:
+            st.warning("Please fill in all fields.")
+            return
+        if not supabase_settings()[0]:
+            st.error("Supabase is not configured. Set SUPABASE_URL and SUPABASE_ANON_KEY.")
+            return
+        try:
+            payload = {"name": name, "email": email, "message": message, "created_at": datetime.utcnow().isoformat()}
+            # One key per submission: a retried send after an error reuses it and
+            # is stored once; sending the same text again later is a new message
+            if "contact_submission_key" not in st.session_state:
+                st.session_state.contact_submission_key = uuid.uuid4().hex
+            get_write_queue().enqueue("contacts", payload, st.session_state.contact_submission_key)
+            st.session_state.contact_submission_key = uuid.uuid4().hex
+            st.success("Thanks! Your message has been sent.")
+            # Show success animation
+            lottie_slot(LOTTIE_SUCCESS, height=150, key="contact_success")
+        except Exception as e:
+            st.error(f"Could not save your message: {e}")
@@ -0,0 +1,163 @@
+import os
+
+import streamlit as st
+
+import forum_events
+import forum_store
+from services import get_supabase
+from ui import format_datetime
+
+RESOURCES = ("forum", "forum_events")
+
+# Live forum updates: refresh interval and how many new posts a session keeps
+FORUM_LIVE_SECONDS = float(os.getenv("FORUM_LIVE_SECONDS", "3"))
+FORUM_LIVE_POSTS = 20
+
+# Forum Page Content
+def render():
+    st.title("💬 Community Forum")
+    st.markdown("Engage with fellow gardening enthusiasts, ask questions, and share experiences.")
+    
+    # The Supabase client is only needed (and only set up) for FORUM_BACKEND=supabase
+    client = get_supabase() if forum_store.FORUM_BACKEND == "supabase" else None
+    forum = forum_store.get_forum_repository(client)
+    
+    with st.form(key="forum_form"):
+        user_name = st.text_input("Your Name", placeholder="Enter your name")
+        post_content = st.text_area("Share your thoughts or ask a question...", height=100)
+        submit_button = st.form_submit_button("Post")
+        
+        if submit_button and user_name and post_content:
+            forum_events.publish("post", forum.add_post(user_name, post_content))
+            st.session_state.forum_cursors = [None]
+            st.success("✅ Your post has been added!")
+            st.rerun()
+    
+    render_forum_search(forum)
+    
+    st.write("### 🌿 Community Discussions")
+    # Keyset cursors of the pages visited so far; the last one is the current page
+    cursors = st.session_state.forum_cursors
+    # The page below is read fresh, so live updates restart from this point
+    st.session_state.forum_event_cursor = forum_events.get_hub().cursor()
+    st.session_state.forum_live = {"posts": [], "replies": {}, "stale": False}
+    render_forum_live()
+    page = forum.list_posts(limit=forum_store.PAGE_SIZE + 1, before=cursors[-1])
+    posts, has_older = page[:forum_store.PAGE_SIZE], len(page) > forum_store.PAGE_SIZE
+    if posts:
+        for post in posts:
+            render_forum_thread(forum, post)
+        col_newer, col_page, col_older = st.columns([1, 2, 1])
+        with col_newer:
+            if len(cursors) > 1 and st.button("← Newer", use_container_width=True):
+                cursors.pop()
+                st.rerun()
+        with col_page:
+            st.caption(f"Page {len(cursors)}")
+        with col_older:
+            if has_older and st.button("Older →", use_container_width=True):
+                cursors.append(forum.cursor_after(posts[-1]))
+                st.rerun()
+    else:
+        st.info("No discussions yet. Be the first to start a conversation!")
+
+# Live forum activity. Every few seconds this fragment asks the shared hub
+# for the events after the session's cursor (an in-memory check, no
+# database query) and shows new posts without rerunning the page.
+@st.fragment(run_every=FORUM_LIVE_SECONDS)
+def render_forum_live():
+    live = st.session_state.forum_live
+    events, cursor, complete = forum_events.get_hub().events_since(st.session_state.forum_event_cursor)
+    st.session_state.forum_event_cursor = cursor
+    live["stale"] = live["stale"] or not complete
+    for event in events:
+        if event["kind"] == "post":
+            live["posts"].insert(0, event["data"])
+            del live["posts"][FORUM_LIVE_POSTS:]
+        else:
+            post_id = event["data"]["post_id"]
+            live["replies"][post_id] = live["replies"].get(post_id, 0) + 1
+    
+    if live["stale"] or (live["posts"] and len(st.session_state.forum_cursors) > 1):
+        count = "Lots of" if live["stale"] else len(live["posts"])
+        if st.button(f"🔔 {count} new posts · show latest", key="forum_live_refresh"):
+            st.session_state.forum_cursors = [None]
+            st.rerun()
+        return
+    for post in live["posts"]:
+        with st.container():
+            st.markdown(f"**🆕 {post['user']} says:**")
+            st.info(post["content"])
+            st.caption(f"Posted on: {format_datetime(post['timestamp'])}")
+    new_replies = sum(live["replies"].values())
+    if new_replies:
+        st.caption(f"🗨️ {new_replies} new repl{'y' if new_replies == 1 else 'ies'} in the threads below")
+
+# Full-text search over posts and replies; typing reruns only this fragment
+@st.fragment
+def render_forum_search(forum):
+    query = st.text_input("🔍 Search the forum", placeholder="e.g. aphids on tomatoes", key="forum_search")
+    if not query.strip():
+        return
+    results = forum.search(query)
+    if not results:
+        st.caption("No matching posts or replies.")
+        return
+    st.caption(f"Top {len(results)} matches")
+    for i, hit in enumerate(results):
+        label = "📝 Post" if hit["kind"] == "post" else "🗨️ Reply"
+        st.markdown(f"{label} by **{hit['user']}** · {format_datetime(hit['timestamp'])}")
+        st.markdown(f"> {hit['snippet']}")
+        view_key = f"search_view_{hit['kind']}_{hit['post_id']}_{i}"
+        if st.toggle("View thread", key=view_key):
+            post = forum.get_post(hit["post_id"])
+            if post:
+                st.info(f"**{post['user']}:** {post['content']}")
+                for reply in forum.replies_for([post["id"]])[post["id"]]:
+                    st.caption(f"🗨️ {reply['user']}: {reply['content']}")
+
+# One forum thread. Replies load only when the thread is expanded, and
+# replying or toggling reruns just this fragment, not the whole page.
+@st.fragment
+def render_forum_thread(forum, post):
+    post_id = post["id"]
+    with st.container():
+        st.markdown(f"**📝 {post['user']} says:**")
+        st.info(post["content"])
+        st.caption(f"Posted on: {format_datetime(post['timestamp'])}")
+        
+        expanded = st.session_state.forum_expanded.get(post_id, False)
+        replies = forum.replies_for([post_id])[post_id] if expanded else None
+        live_replies = st.session_state.forum_live["replies"].get(post_id, 0)
+        reply_count = len(replies) if replies is not None else post["reply_count"] + live_replies
+        
+        col_reply, col_toggle = st.columns([1, 3])
+        with col_reply:
+            if st.button("Reply", key=f"reply_button_{post_id}"):
+                st.session_state.replying[post_id] = not st.session_state.replying.get(post_id, False)
+                st.rerun(scope="fragment")
+        with col_toggle:
+            if reply_count and st.button(
+                f"{'Hide' if expanded else 'Show'} replies ({reply_count})", key=f"toggle_replies_{post_id}"
+            ):
+                st.session_state.forum_expanded[post_id] = not expanded
+                st.rerun(scope="fragment")
+        
+        if st.session_state.replying.get(post_id, False):
+            with st.form(key=f"reply_form_{post_id}"):
+                reply_name = st.text_input("Your Name", placeholder="Enter your name", key=f"reply_name_{post_id}")
+                reply_content = st.text_area("Your Reply...", height=50, key=f"reply_content_{post_id}")
+                reply_submit_button = st.form_submit_button("Submit Reply")
+                
+                if reply_submit_button and reply_name and reply_content:
+                    forum_events.publish("reply", forum.add_reply(post_id, reply_name, reply_content))
+                    st.session_state.replying[post_id] = False
+                    st.session_state.forum_expanded[post_id] = True
+                    st.rerun(scope="fragment")
+        
+        if replies:
+            st.write("**Replies:**")
+            for reply in replies:
+                st.markdown(f"**🗨️ {reply['user']} replied:**")
+                st.info(reply["content"])
+                st.caption(f"Replied on: {format_datetime(reply['timestamp'])}")
@@ -0,0 +1,37 @@
+import streamlit as st
+
+from animations import LOTTIE_PLANT
+from ui import lottie_slot
+
+# Home Page Content
+def render():
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.title("🌿 Welcome to Our RoofTop Gardening Web App!")
+        st.markdown("""
+        RoofTop gardening transforms underutilized rooftop spaces into thriving green areas.
+        This web app serves as your **go-to guide** for starting and maintaining a **cost-effective, sustainable** garden right on your terrace.
+        With easy-to-follow tips and expert recommendations, you can enjoy **fresh, organic produce** while contributing to a greener environment.
+        """)
+    with col2:
+        lottie_slot(LOTTIE_PLANT, height=300, key="home_garden")
+    
+    st.header("🌱 Why RoofTop Gardening?")
+    st.markdown("""
+    - **Utilize Your Space:** Convert rooftops into lush gardens.
+    - **Grow Fresh & Organic:** Enjoy pesticide-free, home-grown produce.
+    - **Cost-Effective Solutions:** Gardening tips that don't break the bank.
+    - **Health & Well-being:** Gardening reduces stress and promotes a healthier lifestyle.
+    - **Eco-Friendly Choice:** Green spaces help lower urban heat and improve air quality.
+    """)
+    
+    st.header("🚀 What You'll Find Here")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.info("✅ **Step-by-step gardening guides**")
+    with col2:
+        st.info("✅ **Best plants for rooftop gardening**")
+    with col3:
+        st.info("✅ **DIY solutions for low-cost gardening**")
+    
+    st.success("🌍 Start your RoofTop gardening journey today and make a positive impact on your health and the environment!")
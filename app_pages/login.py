@@ -0,0 +1,59 @@
+import streamlit as st
+
+import preferences
+from animations import LOTTIE_PLANT
+from app_state import current_user_id, set_auth
+from services import supabase_api, supabase_settings
+from ui import lottie_slot
+
+# Sign in / sign up screen shown until the user is authenticated
+def render():
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        lottie_slot(LOTTIE_PLANT, height=200, key="login_plant")
+        
+        st.title("🔐 Sign in to RoofTop Gardening")
+        st.caption("Please sign in or create an account to continue.")
+        
+        mode = st.radio("", ["Sign In", "Sign Up"], horizontal=True)
+        email = st.text_input("Email")
+        password = st.text_input("Password", type="password")
+        url, key = supabase_settings()
+        if not url:
+            st.error("Supabase is not configured. Set SUPABASE_URL and SUPABASE_ANON_KEY in .env or secrets.")
+            return
+        
+        col_a, col_b = st.columns([1,1])
+        with col_a:
+            if st.button(mode, use_container_width=True):
+                if not email or not password:
+                    st.warning("Enter email and password.")
+                    return
+                api = supabase_api()
+                if api is None:
+                    st.error("The supabase package is not installed.")
+                    return
+                try:
+                    if mode == "Sign In":
+                        res = api.sign_in(url, key, email, password)
+                    else:
+                        res = api.sign_up(url, key, email, password)
+                    user = getattr(res, "user", None) or getattr(res, "session", {}).get("user")
+                    session = getattr(res, "session", None)
+                    if not session:
+                        st.info("Check your email to confirm your account, then sign in.")
+                        return
+                    set_auth(user, session)
+                    st.session_state.perf_profile = preferences.get_store().get(
+                        current_user_id(), "perf_profile", st.session_state.perf_profile
+                    )
+                    st.success("Signed in successfully.")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Auth error: {e}")
+        with col_b:
+            if st.button("Forgot password?", use_container_width=True):
+                st.info("Password recovery must be handled via Supabase auth flows (magic links).")
+
+        st.divider()
+        st.caption("By continuing, you agree to our Terms and Privacy Policy.")
@@ -0,0 +1,86 @@
+import streamlit as st
+
+import catalog
+from cart import add_to_cart, cart_total, get_cart, remove_from_cart
+from services import get_catalog
+from ui import navigate_to
+
+RESOURCES = ("catalog",)
+
+# Order Page Content
+def render():
+    st.title("🛒 Order Supplies")
+    st.markdown("Select items for your rooftop garden and add them to your cart.")
+    render_order_workspace()
+
+# Catalog browsing and the cart. Filtering, paging and adding items rerun only
+# this fragment; the cart is nested inside so an added item shows right away.
+@st.fragment
+def render_order_workspace():
+    index = get_catalog()
+    fcols = st.columns([3, 2])
+    with fcols[0]:
+        search = st.text_input("🔎 Search products", key="catalog_search")
+    with fcols[1]:
+        category = st.selectbox("Category", ["All categories"] + index.categories(), key="catalog_category")
+    category = None if category == "All categories" else category
+    # Back to the first page whenever the filter changes
+    filters = (search, category, index.version)
+    if st.session_state.get("catalog_filters") != filters:
+        st.session_state.catalog_filters = filters
+        st.session_state.catalog_page = 0
+    page = st.session_state.catalog_page
+    products, total = index.query(search, category, offset=page * catalog.PAGE_SIZE)
+    if not products:
+        st.info("No products match your search.")
+
+    for product in products:
+        cols = st.columns([5, 2, 2])
+        with cols[0]:
+            st.write(f"**{product['name']}** — ${product['price']:.2f}")
+            st.caption(product.get("category") or "")
+        with cols[1]:
+            qty = st.number_input(f"Qty {product['id']}", min_value=1, max_value=50, value=1, step=1, key=f"qty_{product['id']}")
+        with cols[2]:
+            if st.button("Add", key=f"add_{product['id']}"):
+                add_to_cart(product, qty)
+                st.toast(f"Added {qty} × {product['name']} to cart")
+
+    pages = max(1, -(-total // catalog.PAGE_SIZE))
+    if pages > 1:
+        pcols = st.columns([1, 2, 1])
+        with pcols[0]:
+            if st.button("← Previous", disabled=page == 0, key="catalog_prev"):
+                st.session_state.catalog_page -= 1
+                st.rerun(scope="fragment")
+        with pcols[1]:
+            st.caption(f"Page {page + 1} of {pages} · {total} products")
+        with pcols[2]:
+            if st.button("Next →", disabled=page >= pages - 1, key="catalog_next"):
+                st.session_state.catalog_page += 1
+                st.rerun(scope="fragment")
+
+    render_cart()
+
+# Cart lines and totals; removing an item redraws only the cart
+@st.fragment
+def render_cart():
+    st.subheader("Your Cart")
+    cart = get_cart()
+    if not cart:
+        st.info("Your cart is empty. Add some items above.")
+        return
+    for ci in list(cart.values()):
+        ccols = st.columns([5, 2, 2])
+        with ccols[0]:
+            st.write(f"{ci['name']} — ${ci['price']:.2f} × {ci['quantity']}")
+        with ccols[1]:
+            st.write(f"${ci['price']*ci['quantity']:.2f}")
+        with ccols[2]:
+            if st.button("Remove", key=f"rm_{ci['id']}"):
+                remove_from_cart(ci["id"])
+                st.rerun(scope="fragment")
+    st.write(f"**Total: ${cart_total():.2f}**")
+    if st.button("Proceed to Checkout"):
+        # Leaving the page needs a full run
+        navigate_to("Checkout")
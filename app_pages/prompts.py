@@ -0,0 +1,55 @@
+import streamlit as st
+
+import answer_store
+import gemini
+from animations import LOTTIE_WATERING
+from chat_ui import answer_question
+from prompt_catalog import PROMPT_CATEGORIES
+from services import setup_gemini
+from ui import lottie_slot
+
+RESOURCES = ("answers", "response_cache")
+
+# Prompts Page Content
+def render():
+    st.title("📝 RoofTop Gardening Prompts")
+    st.markdown("Explore a comprehensive list of prompts to guide your rooftop gardening journey.")
+    
+    # Add Lottie animation at the top
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        lottie_slot(LOTTIE_WATERING, height=200, key="prompts_watering")
+    
+    st.caption("Click a prompt to see its answer.")
+    for c, (category, prompts) in enumerate(PROMPT_CATEGORIES.items()):
+        with st.expander(category, expanded=any(p == st.session_state.get("selected_prompt") for p in prompts)):
+            for i, prompt in enumerate(prompts, 1):
+                if st.button(f"{i}. {prompt}", key=f"prompt_{c}_{i}", use_container_width=True):
+                    st.session_state.selected_prompt = prompt
+                if st.session_state.get("selected_prompt") == prompt:
+                    render_prompt_answer(prompt)
+    
+    with st.expander("View More Categories"):
+        st.header("🌱 Soil Preparation and Maintenance")
+        st.header("🌍 Sustainable Practices in Rooftop Gardening")
+        st.header("🍂 Seasonal Care and Maintenance")
+        st.header("👥 Community and Education")
+        st.header("🚀 Innovations in Rooftop Gardening")
+        st.info("Click on any category above to see specific prompts")
+
+# Show the answer for a catalog prompt, generating it live only on a miss
+def render_prompt_answer(prompt):
+    answer = answer_store.lookup(prompt, gemini.DEFAULT_MODEL)
+    if answer is not None:
+        st.markdown(f"**{answer}**")
+        st.caption("📚 From the precomputed answer library")
+        return
+    model = setup_gemini()
+    if not model:
+        st.info("This answer isn't precomputed yet. Configure a Gemini API key to generate it.")
+        return
+    try:
+        answer_question(model, prompt)
+    except Exception as e:
+        st.session_state.partial_response = None
+        st.error(f"⚠️ Error: Could not process your request. {e}")
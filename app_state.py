@@ -0,0 +1,74 @@
+import uuid
+from types import SimpleNamespace
+
+import streamlit as st
+
+import chat_context
+import session_store
+import theme
+
+# Initialize session state variables
+def init_session_state():
+    if "logged_in" not in st.session_state:
+        st.session_state.logged_in = False
+    if "username" not in st.session_state:
+        st.session_state.username = ""
+    if "water_start_time" not in st.session_state:
+        st.session_state.water_start_time = None
+    if "fertilizer_start_time" not in st.session_state:
+        st.session_state.fertilizer_start_time = None
+    if "replying" not in st.session_state:
+        st.session_state.replying = {}
+    if "forum_expanded" not in st.session_state:
+        st.session_state.forum_expanded = {}
+    if "forum_cursors" not in st.session_state:
+        st.session_state.forum_cursors = [None]
+    if "supabase_user" not in st.session_state:
+        st.session_state.supabase_user = None
+    if "supabase_session" not in st.session_state:
+        st.session_state.supabase_session = None
+    if "perf_profile" not in st.session_state:
+        st.session_state.perf_profile = theme.DEFAULT_PROFILE
+    if "sid" not in st.session_state:
+        st.session_state.sid = uuid.uuid4().hex
+
+# Bulky per-session values (cart, chat history, transcript) live in the
+# server-side session store; session state only holds the session id
+_DEFAULTS = {"cart": dict, "chat_history": chat_context.new_history, "transcript": lambda: None}
+
+def server_value(name):
+    value = session_store.get_store().get(st.session_state.sid, name)
+    return _DEFAULTS[name]() if value is None else value
+
+def save_server_value(name, value):
+    session_store.get_store().put(st.session_state.sid, name, value)
+
+# Mark this session active so the idle timer keeps its values in memory,
+# and record how large its session state has grown
+def touch_session():
+    session_store.get_store().touch(
+        st.session_state.sid, lambda: session_store.approx_size(st.session_state.to_dict().values())
+    )
+
+# Supabase Auth helpers
+def is_authenticated():
+    return st.session_state.supabase_user is not None and st.session_state.supabase_session is not None
+
+# Keep only what the app uses from the Supabase auth objects: the user's id
+# and email, and the tokens needed to refresh and sign out
+def set_auth(user, session):
+    if user is not None:
+        st.session_state.supabase_user = SimpleNamespace(id=getattr(user, "id", None), email=getattr(user, "email", None))
+    st.session_state.supabase_session = None if session is None else SimpleNamespace(
+        access_token=session.access_token,
+        refresh_token=session.refresh_token,
+        expires_at=getattr(session, "expires_at", None),
+    )
+
+def clear_auth():
+    st.session_state.supabase_user = None
+    st.session_state.supabase_session = None
+
+def current_user_id():
+    user = st.session_state.supabase_user
+    return getattr(user, "id", None) or getattr(user, "email", None)
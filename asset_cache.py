@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+
+from storage import atomic_write, data_path
+
+# Cache tuning (all overridable through the environment)
+MEMORY_BUDGET_BYTES = int(os.getenv("LOTTIE_CACHE_BYTES", str(8 * 1024 * 1024)))
+FRESH_SECONDS = int(os.getenv("LOTTIE_FRESH_SECONDS", str(24 * 60 * 60)))
+NEGATIVE_TTL_SECONDS = int(os.getenv("LOTTIE_NEGATIVE_TTL", "600"))
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+# Process-wide cache for remote JSON assets (Lottie animations).
+# Lookups go memory -> disk -> network; the network is only used when an
+# entry is missing or stale, and then with ETag/Last-Modified revalidation.
+class AssetCache:
+    def __init__(self, budget_bytes=MEMORY_BUDGET_BYTES, fresh_seconds=FRESH_SECONDS,
+                 negative_ttl=NEGATIVE_TTL_SECONDS, directory=None):
+        self.budget_bytes = budget_bytes
+        self.fresh_seconds = fresh_seconds
+        self.negative_ttl = negative_ttl
+        self.directory = directory
+        self._entries = OrderedDict()
+        self._used_bytes = 0
+        self._failures = {}
+        self._lock = threading.Lock()
+        self._url_locks = {}
+
+    def get_json(self, url):
+        entry = self._lookup_memory(url)
+        if entry and self._is_fresh(entry):
+            return entry["data"]
+        if self._is_failed(url):
+            return None
+
+        # One fetch per URL at a time; concurrent sessions wait for the first
+        with self._url_lock(url):
+            entry = self._lookup_memory(url)
+            if entry and self._is_fresh(entry):
+                return entry["data"]
+            if self._is_failed(url):
+                return None
+            if entry is None:
+                entry = self._load_disk(url)
+                if entry:
+                    self._remember(url, entry)
+                    if self._is_fresh(entry):
+                        return entry["data"]
+            return self._fetch(url, entry)
+
+    # Return a fresh in-memory copy without touching disk or network
+    def peek(self, url):
+        entry = self._lookup_memory(url)
+        if entry and self._is_fresh(entry):
+            return entry["data"]
+        return None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._failures.clear()
+            self._used_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._used_bytes,
+                    "budget_bytes": self.budget_bytes, "failed_urls": len(self._failures)}
+
+    def _fetch(self, url, stale):
+        headers = {}
+        if stale:
+            if stale.get("etag"):
+                headers["If-None-Match"] = stale["etag"]
+            if stale.get("last_modified"):
+                headers["If-Modified-Since"] = stale["last_modified"]
+        try:
+            r = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            if r.status_code == 304 and stale:
+                stale["fetched_at"] = time.time()
+                self._store(url, stale)
+                return stale["data"]
+            if r.status_code != 200:
+                raise ValueError(f"HTTP {r.status_code}")
+            entry = {
+                "data": r.json(),
+                "size": len(r.content),
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            }
+        except Exception:
+            if stale:
+                # Serve the stale copy and retry revalidation after the negative TTL
+                stale["fetched_at"] = time.time() - self.fresh_seconds + self.negative_ttl
+                self._remember(url, stale)
+                return stale["data"]
+            with self._lock:
+                self._failures[url] = time.time() + self.negative_ttl
+            return None
+        self._store(url, entry)
+        return entry["data"]
+
+    def _store(self, url, entry):
+        self._remember(url, entry)
+        self._save_disk(url, entry)
+
+    def _remember(self, url, entry):
+        with self._lock:
+            self._failures.pop(url, None)
+            old = self._entries.pop(url, None)
+            if old:
+                self._used_bytes -= old["size"]
+            if entry["size"] > self.budget_bytes:
+                return
+            self._entries[url] = entry
+            self._used_bytes += entry["size"]
+            while self._used_bytes > self.budget_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._used_bytes -= evicted["size"]
+
+    def _lookup_memory(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry:
+                self._entries.move_to_end(url)
+            return entry
+
+    def _is_fresh(self, entry):
+        return time.time() - entry["fetched_at"] < self.fresh_seconds
+
+    def _is_failed(self, url):
+        with self._lock:
+            expires_at = self._failures.get(url)
+            if expires_at is None:
+                return False
+            if expires_at <= time.time():
+                del self._failures[url]
+                return False
+            return True
+
+    def _url_lock(self, url):
+        with self._lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def _disk_path(self, url):
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json"
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            return os.path.join(self.directory, name)
+        return data_path("lottie", name)
+
+    def _load_disk(self, url):
+        try:
+            with open(self._disk_path(url), "rb") as f:
+                raw = f.read()
+            record = json.loads(raw)
+            if record.get("url") != url:
+                return None
+            record.pop("url")
+            record["size"] = len(raw)
+            return record
+        except Exception:
+            return None
+
+    def _save_disk(self, url, entry):
+        record = {key: value for key, value in entry.items() if key != "size"}
+        record["url"] = url
+        try:
+            atomic_write(self._disk_path(url), json.dumps(record).encode("utf-8"))
+        except OSError:
+            pass
+
+
+# Shared instance used by every Streamlit session in this process
+_cache = AssetCache()
+
+def get_json(url):
+    return _cache.get_json(url)
+
+def peek(url):
+    return _cache.peek(url)
+
+def cache_stats():
+    return _cache.stats()
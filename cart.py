@@ -0,0 +1,27 @@
+from app_state import save_server_value, server_value
+
+# The cart maps product id -> line item (name and price as added). It lives
+# in the server-side session store and is saved after every change.
+def get_cart():
+    return server_value("cart")
+
+def add_to_cart(item, quantity):
+    qty = max(1, int(quantity))
+    cart = get_cart()
+    cart_item = cart.get(item["id"])
+    if cart_item:
+        cart_item["quantity"] += qty
+    else:
+        cart[item["id"]] = {"id": item["id"], "name": item["name"], "price": item["price"], "quantity": qty}
+    save_server_value("cart", cart)
+
+def remove_from_cart(item_id):
+    cart = get_cart()
+    cart.pop(item_id, None)
+    save_server_value("cart", cart)
+
+def clear_cart():
+    save_server_value("cart", {})
+
+def cart_total():
+    return sum(ci["price"] * ci["quantity"] for ci in get_cart().values())
@@ -0,0 +1,152 @@
+import bisect
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from types import MappingProxyType
+
+# "file" (default, assets/catalog.json) or "supabase" (the `products` table)
+CATALOG_SOURCE = os.getenv("CATALOG_SOURCE", "file")
+CATALOG_PATH = os.getenv("CATALOG_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "assets", "catalog.json"
+)
+REFRESH_SECONDS = float(os.getenv("CATALOG_REFRESH_SECONDS", "300"))
+PAGE_SIZE = 12
+
+_word = re.compile(r"\w+", re.UNICODE)
+
+def _terms(text):
+    return _word.findall(text.lower())
+
+
+# Immutable snapshot of the catalog, shared by every session. Products are
+# read-only mappings; lookups by id and category are dict hits and text
+# search walks a sorted term list, so queries stay cheap with many products.
+class CatalogIndex:
+    def __init__(self, products, version):
+        self.version = version
+        self.products = tuple(MappingProxyType(dict(p)) for p in products)
+        self.by_id = {p["id"]: p for p in self.products}
+        self._position = {p["id"]: i for i, p in enumerate(self.products)}
+        by_category = {}
+        postings = {}
+        for product in self.products:
+            by_category.setdefault(product.get("category") or "Other", []).append(product["id"])
+            text = " ".join(str(product.get(field) or "") for field in ("name", "category", "description"))
+            for term in set(_terms(text)):
+                postings.setdefault(term, set()).add(product["id"])
+        self.by_category = {name: tuple(ids) for name, ids in sorted(by_category.items())}
+        self._terms = sorted(postings)
+        self._postings = postings
+
+    def categories(self):
+        return list(self.by_category)
+
+    # Ids whose text contains every word of `text`, the last as a prefix
+    def _matching_ids(self, text):
+        terms = _terms(text)
+        matches = None
+        for n, term in enumerate(terms):
+            if n < len(terms) - 1:
+                ids = self._postings.get(term, set())
+            else:
+                ids = set()
+                i = bisect.bisect_left(self._terms, term)
+                while i < len(self._terms) and self._terms[i].startswith(term):
+                    ids |= self._postings[self._terms[i]]
+                    i += 1
+            matches = set(ids) if matches is None else matches & ids
+            if not matches:
+                break
+        return matches
+
+    # One page of products in catalog order, plus the total number of matches
+    def query(self, text="", category=None, offset=0, limit=PAGE_SIZE):
+        ids = self.by_category.get(category, ()) if category else None
+        matches = self._matching_ids(text) if text.strip() else None
+        if matches is not None:
+            if ids is not None:
+                matches = matches.intersection(ids)
+            ids = sorted(matches, key=self._position.__getitem__)
+        if ids is None:
+            return list(self.products[offset:offset + limit]), len(self.products)
+        return [self.by_id[i] for i in ids[offset:offset + limit]], len(ids)
+
+
+def load_file(path=CATALOG_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def load_supabase(gateway):
+    res = gateway.table("products").select("id, name, price, category, description").order("id").execute()
+    return res.data or []
+
+def _version(products):
+    return hashlib.sha256(json.dumps(products, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+# Holds the current CatalogIndex and swaps in a new one when the source
+# changes. Readers grab `index` once per render and never see a partial update.
+class Catalog:
+    def __init__(self, source=CATALOG_SOURCE):
+        self.source = source
+        self.index = CatalogIndex([], "empty")
+        self.loaded_at = None
+        self._lock = threading.Lock()
+        self._refresher = None
+
+    # Reload from the source; returns True when the catalog changed. The
+    # local file stays the fallback when Supabase can't be reached.
+    def refresh(self, gateway=None):
+        products = None
+        if self.source == "supabase" and gateway is not None:
+            try:
+                products = load_supabase(gateway)
+            except Exception:
+                products = None
+        if products is None:
+            if self.loaded_at is not None and self.source == "supabase":
+                return False
+            products = load_file()
+        version = _version(products)
+        with self._lock:
+            self.loaded_at = time.time()
+            if version == self.index.version:
+                return False
+            self.index = CatalogIndex(products, version)
+            return True
+
+    # Refresh every REFRESH_SECONDS on a daemon thread, started once per process
+    def start_refresh(self, gateway_factory=lambda: None):
+        if self._refresher is not None:
+            return
+        with self._lock:
+            if self._refresher is not None:
+                return
+            def run():
+                while True:
+                    time.sleep(REFRESH_SECONDS)
+                    try:
+                        self.refresh(gateway_factory())
+                    except Exception:
+                        pass
+            self._refresher = threading.Thread(target=run, name="catalog-refresh", daemon=True)
+            self._refresher.start()
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+# Catalog shared by every session; the first call loads it synchronously
+def get_catalog(gateway_factory=lambda: None):
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                catalog = Catalog()
+                catalog.refresh(gateway_factory())
+                catalog.start_refresh(gateway_factory)
+                _catalog = catalog
+    return _catalog
@@ -0,0 +1,85 @@
+import os
+
+# Context window tuning (all overridable through the environment)
+CONTEXT_BUDGET_TOKENS = int(os.getenv("CHAT_CONTEXT_TOKENS", "3000"))
+RECENT_TURNS = int(os.getenv("CHAT_RECENT_TURNS", "6"))
+SUMMARY_TOKENS = int(os.getenv("CHAT_SUMMARY_TOKENS", "400"))
+
+SUMMARY_PROMPT = (
+    "Summarize this rooftop gardening conversation in at most {words} words. "
+    "Keep the user's goals, their garden details and any advice already given.\n\n"
+    "Earlier summary:\n{summary}\n\nNew turns:\n{turns}"
+)
+
+# Rough token estimate (about four characters per token)
+def estimate_tokens(text):
+    return len(text) // 4 + 1
+
+# Chat history kept in the server-side session store: a rolling summary of older turns plus
+# the most recent turns verbatim ({"role": "user" | "model", "text": ...})
+def new_history():
+    return {"summary": "", "turns": []}
+
+def add_turn(history, role, text):
+    history["turns"].append({"role": role, "text": text})
+
+def history_tokens(history):
+    return estimate_tokens(history["summary"]) + sum(estimate_tokens(t["text"]) for t in history["turns"])
+
+def is_empty(history):
+    return not history["summary"] and not history["turns"]
+
+# Gemini `contents` for the next question: summary first, then recent turns
+def build_contents(history, question):
+    contents = []
+    if history["summary"]:
+        contents.append({"role": "user", "parts": [f"Summary of our conversation so far: {history['summary']}"]})
+        contents.append({"role": "model", "parts": ["Thanks, I'll keep that in mind."]})
+    for turn in history["turns"]:
+        contents.append({"role": turn["role"], "parts": [turn["text"]]})
+    contents.append({"role": "user", "parts": [question]})
+    return contents
+
+# Fold the oldest turns into the rolling summary until the history fits the
+# token budget; the latest `keep_recent` turns always stay verbatim
+def compact(history, summarize=None, budget_tokens=CONTEXT_BUDGET_TOKENS, keep_recent=RECENT_TURNS):
+    if history_tokens(history) <= budget_tokens or len(history["turns"]) <= keep_recent:
+        return history
+    folded = []
+    while len(history["turns"]) > keep_recent and history_tokens(history) > budget_tokens:
+        folded.append(history["turns"].pop(0))
+    if not folded:
+        return history
+    summary = None
+    if summarize:
+        try:
+            summary = summarize(history["summary"], folded)
+        except Exception:
+            summary = None
+    history["summary"] = _truncate(summary or _extractive_summary(history["summary"], folded), SUMMARY_TOKENS)
+    return history
+
+# Summarize folded turns with the chat model itself
+def model_summarizer(model):
+    def summarize(summary, turns):
+        prompt = SUMMARY_PROMPT.format(
+            words=SUMMARY_TOKENS * 3 // 4,
+            summary=summary or "(none)",
+            turns="\n".join(f"{t['role']}: {t['text']}" for t in turns),
+        )
+        return model.generate_content(prompt).text.strip()
+    return summarize
+
+# Fallback summary: the first sentence of every folded turn
+def _extractive_summary(summary, turns):
+    parts = [summary] if summary else []
+    for turn in turns:
+        first_sentence = turn["text"].strip().split(". ")[0]
+        speaker = "User" if turn["role"] == "user" else "Assistant"
+        parts.append(f"{speaker}: {first_sentence}")
+    return " ".join(parts)
+
+# Keep the end of the summary, which holds the most recent context
+def _truncate(text, max_tokens):
+    max_chars = max_tokens * 4
+    return text if len(text) <= max_chars else "…" + text[-max_chars:]
@@ -0,0 +1,68 @@
+import streamlit as st
+
+import chat_context
+import gemini
+import response_cache
+
+# Stream a Gemini answer into the page chunk by chunk. The partial text is
+# kept in session state so a stopped generation can still be shown.
+def stream_chat_response(model, prompt):
+    stop_slot = st.empty()
+    stop_slot.button("⏹ Stop generating", key="stop_generation")
+    answer_slot = st.empty()
+    answer_slot.markdown("_Thinking... 💡_")
+    timings = {}
+    st.session_state.partial_response = ""
+    chunks = gemini.stream_text(model, prompt, timings)
+    try:
+        for text in chunks:
+            st.session_state.partial_response += text
+            answer_slot.markdown(f"**{st.session_state.partial_response}**")
+    finally:
+        chunks.close()
+    answer = st.session_state.partial_response
+    st.session_state.partial_response = None
+    stop_slot.empty()
+    st.session_state.chat_timings = timings
+    if "first_chunk" in timings:
+        st.caption(f"⚡ First chunk in {timings['first_chunk']:.2f}s · complete in {timings['total']:.2f}s")
+    return answer
+
+# Answer a question from the shared response cache, streaming from Gemini on a
+# miss. Follow-up questions carry the conversation and bypass the cache.
+def answer_question(model, question, history=None):
+    if history and not chat_context.is_empty(history):
+        return stream_chat_response(model, chat_context.build_contents(history, question))
+    cache = response_cache.get_cache()
+    cached_answer = cache.get(question, gemini.DEFAULT_MODEL)
+    if cached_answer is not None:
+        st.markdown(f"**{cached_answer}**")
+        st.caption("⚡ Answered instantly from previously generated responses")
+        return cached_answer
+    answer = stream_chat_response(model, question)
+    cache.put(question, answer, gemini.DEFAULT_MODEL)
+    return answer
+
+# Record a finished exchange and keep the history within its token budget
+def record_chat_turn(model, history, question, answer):
+    chat_context.add_turn(history, "user", question)
+    chat_context.add_turn(history, "model", answer)
+    chat_context.compact(history, summarize=chat_context.model_summarizer(model))
+
+# Audio processing function for speech-to-text, showing partial transcripts.
+# Returns the transcript result (text, language, confidence) or None.
+def process_audio(audio_file):
+    # Speech recognition and audio decoding load on the first upload
+    import transcription
+
+    try:
+        partial_slot = st.empty()
+        def show_partial(text):
+            if text:
+                partial_slot.caption(f"📝 {text}…")
+        result = transcription.transcribe_cached(audio_file.getbuffer(), on_partial=show_partial)
+        partial_slot.empty()
+        return result if result["text"] else None
+    except Exception as e:
+        st.error(f"Error processing audio: {e}")
+        return None
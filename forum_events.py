@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from storage import connect
+
+# "memory" (default, single process) or "sqlite" (shared by every process on the host)
+EVENTS_BACKEND = os.getenv("FORUM_EVENTS_BACKEND", "memory")
+HISTORY_SIZE = int(os.getenv("FORUM_EVENTS_HISTORY", "1000"))
+MAX_BATCH = 100
+
+
+# Publish/subscribe hub for forum activity. Every event gets an increasing
+# sequence number; sessions keep the last one they've seen as a cursor and
+# ask only for what came after it. Events are {"seq", "kind", "data"} where
+# kind is "post" or "reply" and data is the stored post or reply.
+class MemoryEventHub:
+    def __init__(self, history=HISTORY_SIZE):
+        self._events = deque(maxlen=history)
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def publish(self, kind, data):
+        with self._lock:
+            self._seq += 1
+            self._events.append({"seq": self._seq, "kind": kind, "data": data})
+            return self._seq
+
+    def cursor(self):
+        with self._lock:
+            return self._seq
+
+    # Events after `cursor`, the new cursor, and whether the list is complete
+    # (False when the cursor fell out of the retained history)
+    def events_since(self, cursor, limit=MAX_BATCH):
+        with self._lock:
+            if cursor >= self._seq:
+                return [], cursor, True
+            oldest = self._events[0]["seq"] if self._events else self._seq + 1
+            events = [e for e in self._events if e["seq"] > cursor][:limit]
+            new_cursor = events[-1]["seq"] if events else self._seq
+            return events, new_cursor, cursor >= oldest - 1
+
+
+# Local broker stand-in: the same interface on top of a SQLite event log, so
+# several app processes on one host see each other's activity
+class SQLiteEventHub:
+    def __init__(self, db_name="forum_events.sqlite3", history=HISTORY_SIZE):
+        self.history = history
+        self._conn = connect(db_name)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS forum_events ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, data TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def publish(self, kind, data):
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO forum_events (kind, data, created_at) VALUES (?, ?, ?)",
+                (kind, json.dumps(data, default=_encode), time.time()),
+            )
+            self._conn.execute("DELETE FROM forum_events WHERE seq <= ?", (cur.lastrowid - self.history,))
+            return cur.lastrowid
+
+    def cursor(self):
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM forum_events").fetchone()[0]
+
+    def events_since(self, cursor, limit=MAX_BATCH):
+        with self._lock:
+            oldest = self._conn.execute("SELECT MIN(seq) FROM forum_events").fetchone()[0]
+            rows = self._conn.execute(
+                "SELECT seq, kind, data FROM forum_events WHERE seq > ? ORDER BY seq LIMIT ?", (cursor, limit)
+            ).fetchall()
+        events = [{"seq": row["seq"], "kind": row["kind"], "data": json.loads(row["data"], object_hook=_decode)}
+                  for row in rows]
+        new_cursor = events[-1]["seq"] if events else cursor
+        return events, new_cursor, oldest is None or cursor >= oldest - 1
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+def _decode(obj):
+    if "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+_hub = None
+_hub_lock = threading.Lock()
+
+# Hub shared by every session in the process
+def get_hub():
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = SQLiteEventHub() if EVENTS_BACKEND == "sqlite" else MemoryEventHub()
+    return _hub
+
+def publish(kind, data):
+    return get_hub().publish(kind, data)
@@ -0,0 +1,314 @@
+import os
+import re
+import threading
+from datetime import datetime
+
+from storage import connect
+
+# "sqlite" (default, local file) or "supabase"
+FORUM_BACKEND = os.getenv("FORUM_BACKEND", "sqlite")
+PAGE_SIZE = 20
+SEARCH_LIMIT = 20
+# Only the most recent matches are ranked, which bounds the cost of very
+# common terms on large forums
+SEARCH_RANK_WINDOW = 2000
+# Bumped when the search index layout changes; older indexes are rebuilt
+SEARCH_INDEX_VERSION = 1
+
+_search_token = re.compile(r"\w+", re.UNICODE)
+
+
+def _parse_timestamp(value):
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+# FTS5 query for free text: every word must match, the last one as a prefix
+# so results show up while the user is still typing
+def fts_query(text):
+    terms = _search_token.findall(text.lower())
+    if not terms:
+        return ""
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+# Storage interface for forum posts and replies. Posts come back newest
+# first as dicts with id, user, content, timestamp and reply_count; pages
+# are addressed with a keyset cursor taken from the last post of a page.
+class ForumRepository:
+    def add_post(self, user, content):
+        raise NotImplementedError
+
+    def add_reply(self, post_id, user, content):
+        raise NotImplementedError
+
+    def get_post(self, post_id):
+        raise NotImplementedError
+
+    def list_posts(self, limit=PAGE_SIZE, before=None):
+        raise NotImplementedError
+
+    # Replies for many posts in one query: {post_id: [reply, ...]}
+    def replies_for(self, post_ids):
+        raise NotImplementedError
+
+    def count_posts(self):
+        raise NotImplementedError
+
+    # Ranked full-text matches over posts and replies, best first. Each hit
+    # has kind ("post" or "reply"), post_id, user, timestamp and a snippet
+    # with the matched terms wrapped in ** for markdown highlighting.
+    def search(self, query, limit=SEARCH_LIMIT):
+        raise NotImplementedError
+
+    # Cursor that makes list_posts continue after this post
+    @staticmethod
+    def cursor_after(post):
+        return (post["timestamp"].isoformat(), post["id"])
+
+
+class SQLiteForumRepository(ForumRepository):
+    def __init__(self, db_name="forum.sqlite3"):
+        self._conn = connect(db_name)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS posts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    reply_count INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS replies (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    post_id INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+                    user TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS posts_created ON posts (created_at DESC, id DESC);
+                CREATE INDEX IF NOT EXISTS replies_thread ON replies (post_id, created_at, id);
+                CREATE VIRTUAL TABLE IF NOT EXISTS forum_fts USING fts5(
+                    content, user, kind UNINDEXED, post_id UNINDEXED, created_at UNINDEXED,
+                    tokenize = 'porter unicode61', prefix = '2 3'
+                );
+                """
+            )
+            self._backfill_search_index()
+            self._conn.commit()
+
+    # (Re)build the search index when it predates SEARCH_INDEX_VERSION. Rows
+    # get rowids in posting order, so the newest matches have the highest rowids.
+    def _backfill_search_index(self):
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] >= SEARCH_INDEX_VERSION:
+            return
+        self._conn.execute("DELETE FROM forum_fts")
+        self._conn.execute(
+            "INSERT INTO forum_fts (content, user, kind, post_id, created_at)"
+            " SELECT content, user, kind, post_id, created_at FROM ("
+            " SELECT content, user, 'post' AS kind, id AS post_id, created_at, id FROM posts"
+            " UNION ALL SELECT content, user, 'reply', post_id, created_at, id FROM replies"
+            ") ORDER BY created_at, id"
+        )
+        self._conn.execute(f"PRAGMA user_version = {SEARCH_INDEX_VERSION}")
+
+    def add_post(self, user, content):
+        timestamp = datetime.now()
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO posts (user, content, created_at) VALUES (?, ?, ?)",
+                (user, content, timestamp.isoformat()),
+            )
+            self._index(content, user, "post", cur.lastrowid, timestamp)
+        return {"id": cur.lastrowid, "user": user, "content": content, "timestamp": timestamp, "reply_count": 0}
+
+    def add_reply(self, post_id, user, content):
+        timestamp = datetime.now()
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO replies (post_id, user, content, created_at) VALUES (?, ?, ?, ?)",
+                (post_id, user, content, timestamp.isoformat()),
+            )
+            self._conn.execute("UPDATE posts SET reply_count = reply_count + 1 WHERE id = ?", (post_id,))
+            self._index(content, user, "reply", post_id, timestamp)
+        return {"id": cur.lastrowid, "post_id": post_id, "user": user, "content": content, "timestamp": timestamp}
+
+    def get_post(self, post_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, user, content, created_at, reply_count FROM posts WHERE id = ?", (post_id,)
+            ).fetchone()
+        return self._post(row) if row else None
+
+    def list_posts(self, limit=PAGE_SIZE, before=None):
+        query = "SELECT id, user, content, created_at, reply_count FROM posts"
+        params = []
+        if before:
+            query += " WHERE (created_at, id) < (?, ?)"
+            params.extend(before)
+        query += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._post(row) for row in rows]
+
+    def replies_for(self, post_ids):
+        post_ids = list(post_ids)
+        replies = {post_id: [] for post_id in post_ids}
+        if not post_ids:
+            return replies
+        placeholders = ",".join("?" * len(post_ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, post_id, user, content, created_at FROM replies"
+                f" WHERE post_id IN ({placeholders}) ORDER BY post_id, created_at, id",
+                post_ids,
+            ).fetchall()
+        for row in rows:
+            replies[row["post_id"]].append({
+                "id": row["id"], "post_id": row["post_id"], "user": row["user"],
+                "content": row["content"], "timestamp": _parse_timestamp(row["created_at"]),
+            })
+        return replies
+
+    def count_posts(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        match = fts_query(query)
+        if not match:
+            return []
+        with self._lock:
+            oldest = self._conn.execute(
+                "SELECT rowid FROM forum_fts WHERE forum_fts MATCH ? ORDER BY rowid DESC LIMIT 1 OFFSET ?",
+                (match, SEARCH_RANK_WINDOW),
+            ).fetchone()
+            rows = self._conn.execute(
+                "SELECT kind, post_id, user, created_at, snippet(forum_fts, 0, '**', '**', '…', 24) AS snippet"
+                " FROM forum_fts WHERE forum_fts MATCH ? AND rowid > ? ORDER BY rank LIMIT ?",
+                (match, oldest[0] if oldest else -1, limit),
+            ).fetchall()
+        return [{
+            "kind": row["kind"], "post_id": row["post_id"], "user": row["user"],
+            "timestamp": _parse_timestamp(row["created_at"]), "snippet": row["snippet"],
+        } for row in rows]
+
+    # Posts and replies share one index and one rowid sequence, assigned in
+    # posting order, so rowid order is time order for the search window
+    def _index(self, content, user, kind, post_id, timestamp):
+        self._conn.execute(
+            "INSERT INTO forum_fts (content, user, kind, post_id, created_at) VALUES (?, ?, ?, ?, ?)",
+            (content, user, kind, post_id, timestamp.isoformat()),
+        )
+
+    @staticmethod
+    def _post(row):
+        return {
+            "id": row["id"], "user": row["user"], "content": row["content"],
+            "timestamp": _parse_timestamp(row["created_at"]), "reply_count": row["reply_count"],
+        }
+
+
+# Supabase tables `forum_posts` and `forum_replies` (see the README schema);
+# a trigger there keeps forum_posts.reply_count up to date
+class SupabaseForumRepository(ForumRepository):
+    def __init__(self, client):
+        self._client = client
+
+    def add_post(self, user, content):
+        res = self._client.table("forum_posts").insert({"user_name": user, "content": content}).execute()
+        return self._post(res.data[0])
+
+    def add_reply(self, post_id, user, content):
+        res = self._client.table("forum_replies").insert(
+            {"post_id": post_id, "user_name": user, "content": content}
+        ).execute()
+        return self._reply(res.data[0])
+
+    def get_post(self, post_id):
+        res = (
+            self._client.table("forum_posts")
+            .select("id, user_name, content, created_at, reply_count")
+            .eq("id", post_id).limit(1).execute()
+        )
+        return self._post(res.data[0]) if res.data else None
+
+    def list_posts(self, limit=PAGE_SIZE, before=None):
+        query = self._client.table("forum_posts").select("id, user_name, content, created_at, reply_count")
+        if before:
+            created_at, post_id = before
+            query = query.or_(f"created_at.lt.{created_at},and(created_at.eq.{created_at},id.lt.{post_id})")
+        res = query.order("created_at", desc=True).order("id", desc=True).limit(limit).execute()
+        return [self._post(row) for row in res.data or []]
+
+    def replies_for(self, post_ids):
+        post_ids = list(post_ids)
+        replies = {post_id: [] for post_id in post_ids}
+        if not post_ids:
+            return replies
+        res = (
+            self._client.table("forum_replies")
+            .select("id, post_id, user_name, content, created_at")
+            .in_("post_id", post_ids)
+            .order("created_at").order("id")
+            .execute()
+        )
+        for row in res.data or []:
+            replies[row["post_id"]].append(self._reply(row))
+        return replies
+
+    def count_posts(self):
+        res = self._client.table("forum_posts").select("id", count="exact").limit(1).execute()
+        return res.count or 0
+
+    # Runs the search_forum() Postgres function from the README schema
+    def search(self, query, limit=SEARCH_LIMIT):
+        terms = _search_token.findall(query.lower())
+        if not terms:
+            return []
+        res = self._client.rpc("search_forum", {"terms": terms, "max_results": limit}).execute()
+        return [{
+            "kind": row["kind"], "post_id": row["post_id"], "user": row["user_name"],
+            "timestamp": _parse_timestamp(row["created_at"]), "snippet": row["snippet"],
+        } for row in res.data or []]
+
+    @staticmethod
+    def cursor_after(post):
+        return (post["created_at_raw"], post["id"])
+
+    @staticmethod
+    def _post(row):
+        return {
+            "id": row["id"], "user": row["user_name"], "content": row["content"],
+            "timestamp": _parse_timestamp(row["created_at"]), "created_at_raw": row["created_at"],
+            "reply_count": row.get("reply_count", 0),
+        }
+
+    @staticmethod
+    def _reply(row):
+        return {
+            "id": row["id"], "post_id": row["post_id"], "user": row["user_name"],
+            "content": row["content"], "timestamp": _parse_timestamp(row["created_at"]),
+        }
+
+
+_sqlite_repository = None
+_sqlite_lock = threading.Lock()
+
+# Forum storage for the configured backend; the SQLite repository is shared
+# by every session in the process
+def get_forum_repository(supabase_client=None):
+    global _sqlite_repository
+    if FORUM_BACKEND == "supabase" and supabase_client is not None:
+        return SupabaseForumRepository(supabase_client)
+    if _sqlite_repository is None:
+        with _sqlite_lock:
+            if _sqlite_repository is None:
+                _sqlite_repository = SQLiteForumRepository()
+    return _sqlite_repository
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+MAX_CLIENTS = int(os.getenv("GEMINI_MAX_CLIENTS", "32"))
+
+# Process-level registry of models keyed by (API key hash, model name)
+_models = OrderedDict()
+_lock = threading.Lock()
+# One lock per key being built, so importing the SDK and building a model
+# never blocks lookups of other keys
+_build_locks = {}
+_warmed_up = set()
+_warm_up_lock = threading.Lock()
+# genai.configure swaps a library-wide default client, so configuring and
+# binding a model's client must not interleave between keys
+_configure_lock = threading.Lock()
+
+# Return a shared model for this API key, creating it once per process
+def get_model(api_key, model_name=DEFAULT_MODEL):
+    key = (hashlib.sha256(api_key.encode("utf-8")).hexdigest(), model_name)
+    with _lock:
+        model = _lookup(key)
+        if model is not None:
+            return model
+        build_lock = _build_locks.setdefault(key, threading.Lock())
+    with build_lock:
+        with _lock:
+            model = _lookup(key)
+        if model is None:
+            model = _build_model(api_key, model_name)
+            with _lock:
+                _models[key] = model
+                _build_locks.pop(key, None)
+                # Keys typed into the sidebar are per user, so keep the registry bounded
+                while len(_models) > MAX_CLIENTS:
+                    _models.popitem(last=False)
+        return model
+
+def _lookup(key):
+    model = _models.get(key)
+    if model is not None:
+        _models.move_to_end(key)
+    return model
+
+def _build_model(api_key, model_name):
+    # The SDK is heavy to import, so load it with the first model
+    import google.generativeai as genai
+
+    try:
+        from google.generativeai import client as genai_client
+    except Exception:
+        genai_client = None
+
+    # genai.configure swaps the library-wide default client, so bind the new
+    # client to the model straight away; configuring another key later then
+    # can't redirect this model's requests
+    with _configure_lock:
+        genai.configure(api_key=api_key)
+        model = genai.GenerativeModel(model_name)
+        try:
+            model._client = genai_client.get_default_generative_client()
+        except Exception:
+            pass
+    return model
+
+# Build the model and open its connection before the first user question
+def warm_up(api_key, model_name=DEFAULT_MODEL):
+    model = get_model(api_key, model_name)
+    try:
+        model.count_tokens("warm-up")
+    except Exception:
+        pass
+    return model
+
+# Warm up once per process without blocking the calling script run
+def warm_up_in_background(api_key, model_name=DEFAULT_MODEL):
+    key = (hashlib.sha256(api_key.encode("utf-8")).hexdigest(), model_name)
+    if key in _warmed_up:
+        return
+    with _warm_up_lock:
+        if key in _warmed_up:
+            return
+        _warmed_up.add(key)
+    threading.Thread(target=warm_up, args=(api_key, model_name), name="gemini-warm-up", daemon=True).start()
+
+# Yield response text as the model produces it. `timings` receives
+# "first_chunk" and "total" in seconds; closing the generator cancels the
+# underlying request.
+def stream_text(model, contents, timings=None):
+    timings = {} if timings is None else timings
+    started = time.perf_counter()
+    response = model.generate_content(contents, stream=True)
+    try:
+        for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunks without text parts (e.g. safety metadata only)
+                continue
+            if not text:
+                continue
+            timings.setdefault("first_chunk", time.perf_counter() - started)
+            yield text
+    finally:
+        timings["total"] = time.perf_counter() - started
+        cancel = getattr(getattr(response, "_iterator", None), "cancel", None)
+        if cancel:
+            try:
+                cancel()
+            except Exception:
+                pass
@@ -0,0 +1,93 @@
+import os
+import threading
+from datetime import datetime
+
+from storage import connect
+
+# "supabase" (default, orders go through the write queue) or "sqlite" (local
+# database with the same transactional semantics, for development and tests)
+ORDER_BACKEND = os.getenv("ORDER_BACKEND", "supabase")
+
+
+# Place an order and all of its items in one call through the place_order()
+# Postgres function from the README schema; returns the order id. The
+# function runs as a single transaction and is idempotent on the key.
+def place_order(gateway, order, items, idempotency_key):
+    res = gateway.rpc("place_order", {"order_row": order, "items": items, "job_key": idempotency_key}).execute()
+    return res.data
+
+
+# Local equivalent of the place_order() function
+class SQLiteOrderStore:
+    def __init__(self, db_name="orders.sqlite3"):
+        self._conn = connect(db_name)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS orders (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    customer_name TEXT NOT NULL,
+                    email TEXT NOT NULL,
+                    address TEXT NOT NULL,
+                    total REAL NOT NULL,
+                    idempotency_key TEXT UNIQUE,
+                    created_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS order_items (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    order_id INTEGER NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
+                    product_id INTEGER NOT NULL,
+                    product_name TEXT NOT NULL,
+                    unit_price REAL NOT NULL,
+                    quantity INTEGER NOT NULL,
+                    UNIQUE (order_id, product_id)
+                );
+                """
+            )
+            self._conn.commit()
+
+    def place_order(self, order, items, idempotency_key):
+        with self._lock, self._conn:
+            existing = self._conn.execute(
+                "SELECT id FROM orders WHERE idempotency_key = ?", (idempotency_key,)
+            ).fetchone()
+            if existing:
+                return existing["id"]
+            order_id = self._conn.execute(
+                "INSERT INTO orders (customer_name, email, address, total, idempotency_key, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (order["customer_name"], order["email"], order["address"], order["total"], idempotency_key,
+                 order.get("created_at") or datetime.utcnow().isoformat()),
+            ).lastrowid
+            self._conn.executemany(
+                "INSERT INTO order_items (order_id, product_id, product_name, unit_price, quantity)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(order_id, item["product_id"], item["product_name"], item["unit_price"], item["quantity"])
+                 for item in items],
+            )
+        return order_id
+
+    def get_order(self, order_id):
+        with self._lock:
+            order = self._conn.execute("SELECT * FROM orders WHERE id = ?", (order_id,)).fetchone()
+            items = self._conn.execute(
+                "SELECT product_id, product_name, unit_price, quantity FROM order_items WHERE order_id = ? ORDER BY id",
+                (order_id,),
+            ).fetchall()
+        if order is None:
+            return None
+        return dict(order, items=[dict(item) for item in items])
+
+
+_local_store = None
+_local_lock = threading.Lock()
+
+# Local order database shared by every session in the process
+def get_local_store():
+    global _local_store
+    if _local_store is None:
+        with _local_lock:
+            if _local_store is None:
+                _local_store = SQLiteOrderStore()
+    return _local_store
@@ -0,0 +1,45 @@
+import json
+import threading
+
+from storage import connect
+
+
+# Small per-user settings (e.g. the performance profile), kept in a local
+# SQLite file so they follow the user across sessions and devices
+class PreferenceStore:
+    def __init__(self, db_name="preferences.sqlite3"):
+        self._conn = connect(db_name)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS preferences ("
+                " user_id TEXT NOT NULL, name TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (user_id, name))"
+            )
+            self._conn.commit()
+
+    def get(self, user_id, name, default=None):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM preferences WHERE user_id = ? AND name = ?", (user_id, name)
+            ).fetchone()
+        return json.loads(row["value"]) if row else default
+
+    def set(self, user_id, name, value):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO preferences (user_id, name, value) VALUES (?, ?, ?)"
+                " ON CONFLICT (user_id, name) DO UPDATE SET value = excluded.value",
+                (user_id, name, json.dumps(value)),
+            )
+
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = PreferenceStore()
+    return _store
@@ -0,0 +1,68 @@
+# Canonical gardening questions shown on the Prompts page
+PROMPT_CATEGORIES = {
+    "🌿 How to Design Rooftop Gardening": [
+        "How to Design Rooftop Gardening",
+        "What are the key considerations for designing a rooftop garden?",
+        "How can I create a layout for my rooftop garden?",
+        "What types of containers are best for rooftop gardening?",
+        "How do I choose the right plants for my rooftop garden design?",
+        "What are the best materials for building raised beds on a rooftop?",
+        "How can I incorporate vertical gardening into my rooftop design?",
+        "What are some creative ways to use space in a small rooftop garden?",
+        "How can I design a rooftop garden that is aesthetically pleasing?",
+        "What are the best practices for ensuring proper drainage in a rooftop garden?",
+        "How can I create shaded areas in my rooftop garden?"
+    ],
+    "🌱 Which Crops to Grow in Which Season": [
+        "What vegetables can I grow in the spring on my rooftop?",
+        "Which herbs thrive in summer rooftop gardens?",
+        "What are the best fall crops for rooftop gardening?",
+        "How can I grow winter vegetables in a rooftop garden?",
+        "What are the best fruits to grow in a rooftop garden by season?",
+        "How do I choose companion plants for my rooftop garden?",
+        "What are the best crops for container gardening on rooftops?",
+        "How can I extend the growing season in my rooftop garden?",
+        "What are the best microgreens to grow indoors or on a rooftop?",
+        "How do seasonal changes affect plant selection for rooftop gardens?"
+    ],
+    "🌿 Proper Manure and Preparation Methods": [
+        "What types of manure are best for rooftop gardening?",
+        "How do I prepare manure for use in my rooftop garden?",
+        "What is the difference between compost and manure?",
+        "How can I make my own organic manure at home?",
+        "What are the benefits of using manure in rooftop gardening?",
+        "How do I apply manure to my rooftop garden?",
+        "What is the proper ratio of manure to soil for container gardening?",
+        "How can I tell if my manure is ready for use?",
+        "What precautions should I take when using manure in my garden?",
+        "How can I store manure safely for future use?"
+    ],
+    "💧 Techniques for Manure and Water Management": [
+        "What are the best techniques for composting on a rooftop?",
+        "How can I integrate rainwater harvesting into my rooftop garden?",
+        "What are the benefits of using drip irrigation in rooftop gardening?",
+        "How do I set up a simple irrigation system for my rooftop garden?",
+        "What are the best practices for watering plants in containers?",
+        "How can I use greywater in my rooftop garden?",
+        "What are the signs of overwatering in rooftop plants?",
+        "How can I create a self-watering system for my rooftop garden?",
+        "What are the best times of day to water rooftop plants?",
+        "How can I prevent water runoff from my rooftop garden?"
+    ],
+    "🐛 Pest Management in Rooftop Gardens": [
+        "What are common pests in rooftop gardens and how can I manage them?",
+        "How can I use companion planting to deter pests?",
+        "What natural pest control methods are effective for rooftop gardens?",
+        "How do I identify signs of pest infestations in my plants?",
+        "What are the best organic pesticides for rooftop gardening?",
+        "How can I attract beneficial insects to my rooftop garden?",
+        "What are the best practices for maintaining plant health to prevent pests?",
+        "How can I create barriers to protect my rooftop garden from pests?",
+        "What role do birds play in pest management on rooftops?",
+        "How can I use traps to control pests in my rooftop garden?"
+    ]
+}
+
+# Every prompt in the catalog, in display order
+def all_prompts():
+    return [prompt for prompts in PROMPT_CATEGORIES.values() for prompt in prompts]
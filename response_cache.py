@@ -0,0 +1,191 @@
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from storage import connect
+
+# Cache tuning (all overridable through the environment)
+TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL", str(7 * 24 * 60 * 60)))
+MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "5000"))
+# Minimum trigram similarity for a near-duplicate hit. The default, 1.0, means
+# exact (normalized) matches only: trigrams can't tell "safe" from "unsafe",
+# so fuzzy matching is opt-in (0.85 works well for rephrased questions)
+SIMILARITY_THRESHOLD = float(os.getenv("RESPONSE_CACHE_SIMILARITY", "1.0"))
+
+_punctuation = re.compile(r"[^\w\s]")
+_whitespace = re.compile(r"\s+")
+
+# Normalize a question so trivially different phrasings share a key
+def normalize(text):
+    text = _punctuation.sub(" ", text.lower())
+    return _whitespace.sub(" ", text).strip()
+
+# Character trigrams of a normalized question, used for similarity matching
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# Chatbot answers keyed by (model, normalized question) with an in-memory
+# LRU, a trigram index for near-duplicate questions and SQLite persistence.
+class ResponseCache:
+    def __init__(self, db_name="responses.sqlite3", ttl_seconds=TTL_SECONDS, max_entries=MAX_ENTRIES,
+                 similarity_threshold=SIMILARITY_THRESHOLD):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self._conn = connect(db_name)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " model TEXT NOT NULL, key TEXT NOT NULL, question TEXT NOT NULL, answer TEXT NOT NULL,"
+            " created_at REAL NOT NULL, last_used REAL NOT NULL, PRIMARY KEY (model, key))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._conn.commit()
+        self._entries = OrderedDict()
+        self._postings = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def get(self, question, model):
+        key = normalize(question)
+        if not key:
+            return None
+        with self._lock:
+            entry_key = (model, key)
+            if entry_key not in self._entries and self.similarity_threshold < 1.0:
+                entry_key = self._most_similar(model, key)
+            entry = self._entries.get(entry_key) if entry_key else None
+            if entry is None:
+                return None
+            if time.time() - entry["created_at"] > self.ttl_seconds:
+                self._drop(entry_key)
+                self._conn.commit()
+                return None
+            self._entries.move_to_end(entry_key)
+            entry["last_used"] = time.time()
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE model = ? AND key = ?",
+                               (entry["last_used"], model, entry_key[1]))
+            self._conn.commit()
+            return entry["answer"]
+
+    def put(self, question, answer, model):
+        key = normalize(question)
+        if not key or not answer:
+            return
+        now = time.time()
+        with self._lock:
+            if (model, key) in self._entries:
+                self._drop((model, key))
+            self._add(model, key, {"question": question, "answer": answer, "created_at": now, "last_used": now})
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (model, key, question, answer, created_at, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (model, key, question, answer, now, now),
+            )
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+            self._conn.commit()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _load(self):
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (cutoff,))
+            rows = self._conn.execute(
+                "SELECT * FROM responses ORDER BY last_used DESC LIMIT ?", (self.max_entries,)
+            ).fetchall()
+            for row in reversed(rows):
+                self._add(row["model"], row["key"], {
+                    "question": row["question"], "answer": row["answer"],
+                    "created_at": row["created_at"], "last_used": row["last_used"],
+                })
+            self._conn.commit()
+
+    def _add(self, model, key, entry):
+        entry["trigrams"] = trigrams(key)
+        self._entries[(model, key)] = entry
+        for gram in entry["trigrams"]:
+            self._postings.setdefault((model, gram), set()).add(key)
+
+    def _drop(self, entry_key):
+        model, key = entry_key
+        entry = self._entries.pop(entry_key, None)
+        if entry:
+            for gram in entry["trigrams"]:
+                keys = self._postings.get((model, gram))
+                if keys:
+                    keys.discard(key)
+                    if not keys:
+                        del self._postings[(model, gram)]
+        self._conn.execute("DELETE FROM responses WHERE model = ? AND key = ?", (model, key))
+
+    # Jaccard similarity over trigrams, scoring only keys that share a trigram
+    def _most_similar(self, model, key):
+        grams = trigrams(key)
+        shared = {}
+        for gram in grams:
+            for candidate in self._postings.get((model, gram), ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        best_key, best_score = None, 0.0
+        for candidate, count in shared.items():
+            size = len(self._entries[(model, candidate)]["trigrams"])
+            score = count / (len(grams) + size - count)
+            if score > best_score:
+                best_key, best_score = candidate, score
+        if best_key is None or best_score < self.similarity_threshold:
+            return None
+        return (model, best_key)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+# Shared cache instance for every session in this process
+def get_cache():
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
+
+# Generate and cache answers for questions that aren't cached yet
+def prewarm(model, questions, model_name, delay_seconds=1.0, log=print):
+    cache = get_cache()
+    generated = 0
+    for question in questions:
+        if cache.get(question, model_name) is not None:
+            continue
+        try:
+            answer = model.generate_content(question).text
+        except Exception as e:
+            log(f"  failed: {question} ({e})")
+            continue
+        cache.put(question, answer, model_name)
+        generated += 1
+        log(f"  cached: {question}")
+        time.sleep(delay_seconds)
+    return generated
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["prewarm"]:
+        print("usage: python response_cache.py prewarm")
+        sys.exit(2)
+    from dotenv import load_dotenv
+
+    import gemini
+    from prompt_catalog import all_prompts
+
+    load_dotenv()
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        print("GEMINI_API_KEY is not set")
+        sys.exit(1)
+    count = prewarm(gemini.get_model(api_key), all_prompts(), gemini.DEFAULT_MODEL)
+    print(f"Generated {count} new answer(s); {len(get_cache())} cached in total")
@@ -0,0 +1,99 @@
+import os
+
+import streamlit as st
+
+import answer_store
+import catalog
+import forum_store
+import gemini
+import write_queue
+from app_state import set_auth
+
+# Shared services the pages use: Supabase access, the write queue, the
+# product catalog and the Gemini model
+
+# Supabase access through the process-wide connection pool. The SDK is
+# imported on first use (None when it isn't installed).
+def supabase_api():
+    try:
+        import supabase_client
+    except Exception:
+        return None
+    return supabase_client
+
+def _get_secret(name):
+    try:
+        if hasattr(st, "secrets") and name in st.secrets:
+            return st.secrets.get(name)
+    except Exception:
+        return None
+    return None
+
+# Warm up the shared Gemini client once per process
+def warm_up_gemini():
+    api_key = os.getenv("GEMINI_API_KEY") or _get_secret("GEMINI_API_KEY")
+    if api_key:
+        gemini.warm_up_in_background(api_key)
+
+def supabase_settings():
+    url = os.getenv("SUPABASE_URL") or _get_secret("SUPABASE_URL")
+    key = os.getenv("SUPABASE_ANON_KEY") or _get_secret("SUPABASE_ANON_KEY")
+    if not url or not key:
+        return None, None
+    return url, key
+
+# Table/RPC access acting as the signed-in user. Requests share one process
+# connection pool; only the user's session (and its token) lives in session state.
+def get_supabase():
+    url, key = supabase_settings()
+    api = supabase_api()
+    if not url or api is None:
+        return None
+    session = st.session_state.supabase_session
+    if session is not None:
+        try:
+            refreshed = api.fresh_session(url, key, session)
+            if refreshed is not session:
+                set_auth(None, refreshed)
+                session = st.session_state.supabase_session
+        except Exception:
+            pass
+    return api.get_gateway(url, key, session)
+
+# Anon-key gateway for background workers, or None without Supabase
+def service_gateway():
+    url, key = supabase_settings()
+    api = supabase_api()
+    return api.get_gateway(url, key) if url and api else None
+
+# Outbox for contact messages and orders; its worker writes with the anon key
+def get_write_queue():
+    queue = write_queue.get_queue()
+    if supabase_settings()[0]:
+        queue.start(service_gateway)
+    return queue
+
+# Product catalog shared by every session (assets/catalog.json or the
+# Supabase `products` table, see CATALOG_SOURCE)
+def get_catalog():
+    if catalog.CATALOG_SOURCE == "supabase":
+        return catalog.get_catalog(service_gateway).index
+    return catalog.get_catalog().index
+
+# Get the shared Gemini AI model for this user's API key
+def setup_gemini():
+    api_key = os.getenv("GEMINI_API_KEY") or _get_secret("GEMINI_API_KEY")
+    if not api_key:
+        api_key = st.sidebar.text_input("Enter Gemini API Key", type="password")
+        if not api_key:
+            st.sidebar.warning("Please enter a valid API key to use the chatbot.")
+            return None
+    return gemini.get_model(api_key)
+
+# Resource warmers for the page registry (see app_pages)
+def load_answer_store():
+    return answer_store.load_store(gemini.DEFAULT_MODEL)
+
+def open_local_forum():
+    if forum_store.FORUM_BACKEND == "sqlite":
+        forum_store.get_forum_repository()
@@ -0,0 +1,212 @@
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from storage import connect
+
+# Hot values stay in memory while their session is active; everything is
+# persisted to SQLite so an evicted session picks up where it left off
+IDLE_SECONDS = float(os.getenv("SESSION_IDLE_SECONDS", "900"))
+SESSION_TTL = float(os.getenv("SESSION_TTL_SECONDS", str(24 * 3600)))
+MEMORY_BYTES = int(os.getenv("SESSION_CACHE_BYTES", str(32 * 1024 * 1024)))
+EVICT_INTERVAL = 60.0
+# How often a session's last_seen is written back to disk
+TOUCH_WRITE_SECONDS = 30.0
+
+
+# Server-side storage for per-session data (cart, chat history, transcript).
+# Streamlit's session state keeps only the session id; values live here,
+# in a byte-bounded memory cache in front of a SQLite file. A timer drops
+# idle sessions from memory and expired ones from disk.
+class SessionStore:
+    def __init__(self, db_name="sessions.sqlite3", max_bytes=MEMORY_BYTES):
+        self.max_bytes = max_bytes
+        self._conn = connect(db_name)
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._bytes = 0
+        self._last_seen = {}
+        self._last_written = {}
+        self._evictor = None
+        with self._lock:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    last_seen REAL NOT NULL,
+                    state_bytes INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS session_data (
+                    session_id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    PRIMARY KEY (session_id, name)
+                );
+                CREATE INDEX IF NOT EXISTS sessions_last_seen ON sessions (last_seen);
+                """
+            )
+            self._conn.commit()
+
+    # The stored value, or `default` when the session has none. Mutable values
+    # come back as the cached object itself; call put() after changing them.
+    def get(self, session_id, name, default=None):
+        key = (session_id, name)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                return entry[0]
+            row = self._conn.execute(
+                "SELECT value FROM session_data WHERE session_id = ? AND name = ?", key
+            ).fetchone()
+            if row is None:
+                return default
+            value = pickle.loads(row["value"])
+            self._remember(key, value, len(row["value"]))
+            return value
+
+    def put(self, session_id, name, value):
+        key = (session_id, name)
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO session_data (session_id, name, value) VALUES (?, ?, ?)"
+                " ON CONFLICT (session_id, name) DO UPDATE SET value = excluded.value",
+                (session_id, name, blob),
+            )
+            self._conn.execute(
+                "INSERT INTO sessions (session_id, last_seen) VALUES (?, ?)"
+                " ON CONFLICT (session_id) DO UPDATE SET last_seen = excluded.last_seen",
+                (session_id, time.time()),
+            )
+            self._forget(key)
+            self._remember(key, value, len(blob))
+
+    # Mark the session active. `measure` returns the size of its Streamlit
+    # session state for the usage report; it is only called when last_seen
+    # is written back, at most every TOUCH_WRITE_SECONDS.
+    def touch(self, session_id, measure=None):
+        now = time.time()
+        with self._lock:
+            self._last_seen[session_id] = now
+            if now - self._last_written.get(session_id, 0) < TOUCH_WRITE_SECONDS:
+                return
+            self._last_written[session_id] = now
+        state_bytes = measure() if measure else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sessions (session_id, last_seen, state_bytes) VALUES (?, ?, ?)"
+                " ON CONFLICT (session_id) DO UPDATE SET last_seen = excluded.last_seen,"
+                " state_bytes = COALESCE(?, state_bytes)",
+                (session_id, now, state_bytes or 0, state_bytes),
+            )
+
+    # Drop idle sessions from memory and expired ones from disk
+    def evict(self, idle_seconds=IDLE_SECONDS, ttl=SESSION_TTL):
+        now = time.time()
+        with self._lock:
+            idle = {sid for sid, seen in self._last_seen.items() if now - seen > idle_seconds}
+            for key in [key for key in self._cache if key[0] in idle or key[0] not in self._last_seen]:
+                self._forget(key)
+            for sid in idle:
+                del self._last_seen[sid]
+                self._last_written.pop(sid, None)
+            with self._conn:
+                expired = now - ttl
+                self._conn.execute(
+                    "DELETE FROM session_data WHERE session_id IN (SELECT session_id FROM sessions WHERE last_seen < ?)",
+                    (expired,),
+                )
+                removed = self._conn.execute("DELETE FROM sessions WHERE last_seen < ?", (expired,)).rowcount
+        return len(idle), removed
+
+    # Per-session usage: bytes cached in memory, bytes stored on disk and
+    # the size of its Streamlit session state
+    def usage(self):
+        with self._lock:
+            memory = {}
+            for (sid, _), (_, size) in self._cache.items():
+                memory[sid] = memory.get(sid, 0) + size
+            rows = self._conn.execute(
+                "SELECT s.session_id, s.last_seen, s.state_bytes, COALESCE(SUM(LENGTH(d.value)), 0) AS stored"
+                " FROM sessions s LEFT JOIN session_data d ON d.session_id = s.session_id"
+                " GROUP BY s.session_id ORDER BY stored DESC"
+            ).fetchall()
+            active = set(self._last_seen)
+        return [{
+            "session_id": row["session_id"], "active": row["session_id"] in active,
+            "last_seen": row["last_seen"], "memory_bytes": memory.get(row["session_id"], 0),
+            "stored_bytes": row["stored"], "state_bytes": row["state_bytes"],
+        } for row in rows]
+
+    def stats(self):
+        with self._lock:
+            return {"memory_bytes": self._bytes, "cached_values": len(self._cache), "active_sessions": len(self._last_seen)}
+
+    def start_eviction(self):
+        if self._evictor is not None:
+            return
+        with self._lock:
+            if self._evictor is not None:
+                return
+            def run():
+                while True:
+                    time.sleep(EVICT_INTERVAL)
+                    try:
+                        self.evict()
+                    except Exception:
+                        pass
+            self._evictor = threading.Thread(target=run, name="session-evict", daemon=True)
+            self._evictor.start()
+
+    def _remember(self, key, value, size):
+        self._cache[key] = (value, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes and len(self._cache) > 1:
+            _, (_, evicted_size) = self._cache.popitem(last=False)
+            self._bytes -= evicted_size
+
+    def _forget(self, key):
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+
+# Rough size of a session state: pickled size where possible, shallow size
+# for objects that can't be pickled (widgets' placeholders, futures)
+def approx_size(items):
+    total = 0
+    for value in items:
+        try:
+            total += len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            total += sys.getsizeof(value)
+    return total
+
+
+_store = None
+_store_lock = threading.Lock()
+
+# Session store shared by every session in the process
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SessionStore()
+                _store.start_eviction()
+    return _store
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "report":
+        print("Usage: python session_store.py report")
+        sys.exit(1)
+    sessions = SessionStore().usage()
+    print(f"{len(sessions)} stored session(s)")
+    for entry in sessions[:50]:
+        idle = time.time() - entry["last_seen"]
+        print(f"  {entry['session_id'][:12]}  stored {entry['stored_bytes']:>9,} B"
+              f"  state {entry['state_bytes']:>9,} B  idle {idle / 60:6.1f} min")
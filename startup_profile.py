@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+from storage import data_path
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_SCRIPT = os.path.join(APP_DIR, "main.py")
+BENCH_LOG = "startup_bench.jsonl"
+
+# Dependencies the pages load on first use, profiled one by one
+LAZY_MODULES = ["google.generativeai", "speech_recognition", "pydub", "supabase", "streamlit_lottie"]
+
+# One cold start in a fresh interpreter: time to the end of the first script
+# run (the first render) and of a rerun in the same process
+_BENCH_SNIPPET = """
+import json, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+app = AppTest.from_file({script!r}, default_timeout=120)
+app.run()
+first_render = time.perf_counter()
+app.run()
+rerun = time.perf_counter()
+print(json.dumps({{
+    "streamlit_import": imported - started,
+    "first_render": first_render - imported,
+    "rerun": rerun - first_render,
+    "exceptions": len(app.exception),
+}}))
+"""
+
+
+# Cumulative import time of `module` and of each module it imports directly,
+# from `python -X importtime`
+def import_times(module):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=APP_DIR, capture_output=True, text=True,
+    )
+    children = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented two spaces per level, and are listed
+        # before the module that triggered them
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        seconds = int(cumulative) / 1e6
+        if depth == 1:
+            children[name.strip()] = seconds
+        elif depth == 0:
+            if name.strip() == module:
+                return seconds, children, proc.returncode == 0
+            children = {}
+    return 0.0, {}, False
+
+def report_imports(top=15):
+    total, children, ok = import_times("main")
+    print(f"Importing main.py: {total:.3f}s{'' if ok else ' (import failed)'}")
+    for name, seconds in sorted(children.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {seconds:8.3f}s  {name}")
+    print("Loaded on first use by the pages that need them:")
+    for module in LAZY_MODULES:
+        seconds, _, ok = import_times(module)
+        print(f"  {seconds:8.3f}s  {module}" + ("" if ok else "  (not installed)"))
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# Cold-start `runs` fresh app processes and append the medians to the
+# benchmark log, one JSON line per invocation, so versions can be compared
+def benchmark(runs=5, output=None):
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", _BENCH_SNIPPET.format(script=APP_SCRIPT)],
+            cwd=APP_DIR, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "benchmark run failed")
+        samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    record = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "runs": runs,
+        "first_render": statistics.median(s["first_render"] for s in samples),
+        "rerun": statistics.median(s["rerun"] for s in samples),
+        "streamlit_import": statistics.median(s["streamlit_import"] for s in samples),
+        "exceptions": max(s["exceptions"] for s in samples),
+    }
+    with open(output or data_path(BENCH_LOG), "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+    return record
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile app imports and benchmark cold starts")
+    parser.add_argument("command", choices=["imports", "bench"])
+    parser.add_argument("--runs", type=int, default=5, help="cold starts to measure (bench)")
+    parser.add_argument("--output", default=None, help=f"benchmark log (default .data/{BENCH_LOG})")
+    parser.add_argument("--top", type=int, default=15, help="modules to list (imports)")
+    args = parser.parse_args()
+
+    if args.command == "imports":
+        report_imports(args.top)
+    else:
+        record = benchmark(args.runs, args.output)
+        print(f"First render {record['first_render']:.3f}s, rerun {record['rerun']:.3f}s "
+              f"(median of {record['runs']}, commit {record['commit']})")
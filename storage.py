@@ -0,0 +1,27 @@
+import os
+import sqlite3
+
+# Root directory for local caches and stores (override with RTG_DATA_DIR)
+DATA_DIR = os.getenv("RTG_DATA_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data")
+
+# Build a path under the data directory, creating parent folders as needed
+def data_path(*parts):
+    path = os.path.join(DATA_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+# Write a file atomically so readers never see a half-written file
+def atomic_write(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+# Open a SQLite database under the data directory that can be shared by
+# the threads serving different sessions
+def connect(name):
+    conn = sqlite3.connect(data_path(name), timeout=30, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
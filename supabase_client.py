@@ -0,0 +1,129 @@
+import os
+import threading
+import time
+
+import httpx
+from postgrest import SyncPostgrestClient
+from supabase import create_client
+from supabase.lib.client_options import ClientOptions
+
+# Connection pool shared by every session in the process
+POOL_CONNECTIONS = int(os.getenv("SUPABASE_POOL_CONNECTIONS", "20"))
+POOL_KEEPALIVE = int(os.getenv("SUPABASE_POOL_KEEPALIVE", "10"))
+KEEPALIVE_SECONDS = 30.0
+REQUEST_TIMEOUT = httpx.Timeout(10.0, connect=3.05)
+HEALTH_CHECK_SECONDS = float(os.getenv("SUPABASE_HEALTH_SECONDS", "30"))
+# Refresh a user's access token when it has less than this long to live
+TOKEN_REFRESH_MARGIN = 60
+
+_transport = None
+_transport_lock = threading.Lock()
+_health = {"healthy": None, "checked_at": None, "latency": None, "error": None}
+_health_thread = None
+_health_lock = threading.Lock()
+
+def _shared_transport():
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = httpx.HTTPTransport(
+                    limits=httpx.Limits(
+                        max_connections=POOL_CONNECTIONS,
+                        max_keepalive_connections=POOL_KEEPALIVE,
+                        keepalive_expiry=KEEPALIVE_SECONDS,
+                    ),
+                    retries=1,
+                )
+    return _transport
+
+
+# PostgREST client whose requests go through the shared pool. Creating one is
+# cheap (no sockets or TLS setup of its own), so one is built per user token.
+class _PooledPostgrestClient(SyncPostgrestClient):
+    def create_session(self, base_url, headers, timeout, *args, **kwargs):
+        return httpx.Client(
+            base_url=base_url, headers=headers, timeout=REQUEST_TIMEOUT,
+            transport=_shared_transport(), follow_redirects=True,
+        )
+
+
+# Table and RPC access for one caller. Requests carry the caller's access
+# token (or the anon key when signed out) so row level security still applies.
+class SupabaseGateway:
+    def __init__(self, url, key, access_token=None):
+        self.url = url
+        self.key = key
+        self._rest = _PooledPostgrestClient(
+            f"{url}/rest/v1",
+            headers={"apiKey": key, "Authorization": f"Bearer {access_token or key}"},
+        )
+
+    def table(self, name):
+        return self._rest.from_(name)
+
+    def rpc(self, name, params=None):
+        return self._rest.rpc(name, params or {})
+
+
+# Gateway for a signed-in user's session, or the anon gateway without one.
+# Returns None when Supabase isn't configured.
+def get_gateway(url, key, session=None):
+    if not url or not key:
+        return None
+    start_health_checks(url, key)
+    return SupabaseGateway(url, key, getattr(session, "access_token", None))
+
+
+# Auth calls go through a short-lived client that neither persists the
+# session nor starts refresh timers; the caller keeps the returned session
+def _auth_client(url, key):
+    return create_client(url, key, options=ClientOptions(persist_session=False, auto_refresh_token=False)).auth
+
+def sign_in(url, key, email, password):
+    return _auth_client(url, key).sign_in_with_password({"email": email, "password": password})
+
+def sign_up(url, key, email, password):
+    return _auth_client(url, key).sign_up({"email": email, "password": password})
+
+def sign_out(url, key, session):
+    _auth_client(url, key).admin.sign_out(session.access_token)
+
+# The same session while its token is still valid, otherwise a refreshed one
+def fresh_session(url, key, session):
+    expires_at = getattr(session, "expires_at", None)
+    if not expires_at or expires_at - time.time() > TOKEN_REFRESH_MARGIN:
+        return session
+    return _auth_client(url, key).refresh_session(session.refresh_token).session or session
+
+
+# Background health check: a cheap request through the pool every
+# HEALTH_CHECK_SECONDS, which also keeps a warm connection open
+def check_health(url, key):
+    started = time.perf_counter()
+    try:
+        # Not closed: closing a client would close the shared transport
+        client = httpx.Client(transport=_shared_transport(), timeout=REQUEST_TIMEOUT)
+        response = client.get(f"{url}/rest/v1/", headers={"apiKey": key, "Authorization": f"Bearer {key}"})
+        _health.update(healthy=response.status_code < 500, error=None)
+    except httpx.HTTPError as e:
+        _health.update(healthy=False, error=str(e))
+    _health.update(checked_at=time.time(), latency=time.perf_counter() - started)
+    return _health["healthy"]
+
+def start_health_checks(url, key):
+    global _health_thread
+    if _health_thread is not None:
+        return
+    with _health_lock:
+        if _health_thread is not None:
+            return
+        def run():
+            while True:
+                check_health(url, key)
+                time.sleep(HEALTH_CHECK_SECONDS)
+        _health_thread = threading.Thread(target=run, name="supabase-health", daemon=True)
+        _health_thread.start()
+
+def health():
+    return dict(_health)
@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import threading
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+# Files under static/ are served at app/static/ (server.enableStaticServing).
+# A ?v= query string makes the static handler send long-lived cache headers,
+# so the URL carries a content hash and changes whenever the file does.
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STYLESHEET = "theme.css"
+
+# Floating particles and falling leaves behind the app
+DECORATIONS = """
+<div class="particles-container">
+    <div class="particle"></div>
+    <div class="particle"></div>
+    <div class="particle"></div>
+    <div class="particle"></div>
+</div>
+<div class="leaves-container">
+    <div class="leaf">🍃</div>
+    <div class="leaf">🍂</div>
+    <div class="leaf">🍃</div>
+    <div class="leaf">🌿</div>
+    <div class="leaf">🍂</div>
+    <div class="leaf">🍃</div>
+    <div class="leaf">🌿</div>
+    <div class="leaf">🍂</div>
+</div>
+"""
+
+# Streamlit serves .css as text/plain with nosniff, which browsers refuse as a
+# <link> stylesheet, so the loader fetches it (from the browser cache after the
+# first visit) and adds it to the page as a <style> element. Font URLs are
+# made absolute because the rules no longer live at the stylesheet's URL.
+# The loader runs in the app's own document so it survives the component
+# iframe being removed on the next rerun.
+_LOADER = """
+(function () {
+  document.documentElement.dataset.rtgProfile = %(profile)s;
+  const href = new URL(%(href)s, document.baseURI);
+  if (!document.getElementById(%(style_id)s)) {
+    fetch(href, {cache: "force-cache"})
+      .then((response) => response.text())
+      .then((css) => {
+        const style = document.createElement("style");
+        style.id = %(style_id)s;
+        style.textContent = css.replace(/url\\('(?!data:|https?:)/g, "url('" + new URL(".", href));
+        document.querySelectorAll("style[id^='rtg-theme-']").forEach((old) => old.remove());
+        document.head.appendChild(style);
+      });
+  }
+  if (!document.getElementById("rtg-decorations")) {
+    const decorations = document.createElement("div");
+    decorations.id = "rtg-decorations";
+    decorations.innerHTML = %(decorations)s;
+    document.body.appendChild(decorations);
+  }
+})();
+"""
+
+_BOOTSTRAP = """
+<script>
+const script = window.parent.document.createElement("script");
+script.textContent = %s;
+window.parent.document.head.appendChild(script);
+</script>
+"""
+
+# Performance profiles, from the full animated theme down to no motion at all
+# (which also skips Lottie animations). "auto" is the full theme unless the
+# device asks for reduced motion.
+PROFILES = {
+    "auto": "Auto (follow device setting)",
+    "full": "Full animations",
+    "reduced": "Reduced motion",
+    "static": "Static (lowest CPU)",
+}
+DEFAULT_PROFILE = "auto"
+
+_versions = {}
+_versions_lock = threading.Lock()
+
+# Content hash of a static file, computed once per process
+def asset_version(name):
+    version = _versions.get(name)
+    if version is None:
+        with _versions_lock:
+            with open(os.path.join(STATIC_DIR, name), "rb") as f:
+                version = hashlib.sha256(f.read()).hexdigest()[:12]
+            _versions[name] = version
+    return version
+
+def asset_url(name):
+    return f"app/static/{name}?v={asset_version(name)}"
+
+# Load the theme into the browser once per session (and again only when the
+# profile changes). Other reruns send nothing; the stylesheet and
+# decorations stay in the page.
+def apply_theme(profile=DEFAULT_PROFILE):
+    version = asset_version(STYLESHEET)
+    if st.session_state.get("_theme_version") == (version, profile):
+        return
+    loader = _LOADER % {
+        "profile": json.dumps(profile),
+        "href": json.dumps(asset_url(STYLESHEET)),
+        "style_id": json.dumps(f"rtg-theme-{version}"),
+        "decorations": json.dumps(DECORATIONS),
+    }
+    components.html(_BOOTSTRAP % json.dumps(loader).replace("</", "<\\/"), height=0)
+    st.session_state._theme_version = (version, profile)
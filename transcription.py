@@ -0,0 +1,411 @@
+import hashlib
+import json
+import os
+import struct
+import subprocess
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import speech_recognition as sr
+
+from storage import connect
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop
+    except ImportError:
+        # Python 3.13+ dropped audioop; pydub ships a pure-Python version
+        from pydub import pyaudioop as audioop
+
+# Transcription tuning (all overridable through the environment)
+DEFAULT_BACKEND = os.getenv("TRANSCRIPTION_BACKEND", "auto")
+LANGUAGE = os.getenv("TRANSCRIPTION_LANGUAGE", "en-US")
+VOSK_MODEL_PATH = os.getenv("VOSK_MODEL_PATH", "")
+WORKERS = int(os.getenv("TRANSCRIPTION_WORKERS", "4"))
+SILENCE_THRESH_DBFS = float(os.getenv("TRANSCRIPTION_SILENCE_DBFS", "-40"))
+FFMPEG = os.getenv("FFMPEG_BINARY", "ffmpeg")
+# How much of ffmpeg's error output is kept for the error message
+FFMPEG_ERROR_BYTES = 4096
+FRAME_MS = 20
+MIN_SILENCE_MS = 500
+MIN_CHUNK_MS = 5 * 1000
+MAX_CHUNK_MS = 30 * 1000
+CHUNK_PADDING_MS = 200
+BLOCK_MS = 500
+SAMPLE_RATE = 16000
+MIN_WAV_RATE = 8000
+MAX_WAV_RATE = 48000
+CACHE_MEMORY_ENTRIES = int(os.getenv("TRANSCRIPT_CACHE_MEMORY_ENTRIES", "256"))
+CACHE_DISK_ENTRIES = int(os.getenv("TRANSCRIPT_CACHE_ENTRIES", "5000"))
+
+_executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="transcribe")
+
+
+# Backends take an sr.AudioData chunk and return {"text", "confidence"}
+def _recognize_google(audio_data):
+    result = sr.Recognizer().recognize_google(audio_data, language=LANGUAGE, show_all=True)
+    alternatives = result.get("alternative", []) if isinstance(result, dict) else []
+    if not alternatives:
+        return {"text": "", "confidence": None}
+    best = alternatives[0]
+    return {"text": best.get("transcript", ""), "confidence": best.get("confidence")}
+
+def _recognize_sphinx(audio_data):
+    try:
+        text = sr.Recognizer().recognize_sphinx(audio_data, language=LANGUAGE)
+    except sr.UnknownValueError:
+        text = ""
+    return {"text": text, "confidence": None}
+
+_vosk_model = None
+_vosk_lock = threading.Lock()
+
+def _load_vosk_model():
+    global _vosk_model
+    if _vosk_model is None:
+        with _vosk_lock:
+            if _vosk_model is None:
+                from vosk import Model, SetLogLevel
+
+                SetLogLevel(-1)
+                # Without a model path Vosk downloads the model for the
+                # language (codes like "en-us") and exits the process when it
+                # can't find one, so turn that into an ordinary error
+                try:
+                    _vosk_model = Model(VOSK_MODEL_PATH) if VOSK_MODEL_PATH else Model(lang=LANGUAGE.lower())
+                except (Exception, SystemExit) as e:
+                    raise RuntimeError(f"Could not load the Vosk model for {LANGUAGE}: {e}") from None
+    return _vosk_model
+
+def _recognize_vosk(audio_data):
+    from vosk import KaldiRecognizer
+
+    recognizer = KaldiRecognizer(_load_vosk_model(), SAMPLE_RATE)
+    recognizer.SetWords(True)
+    recognizer.AcceptWaveform(audio_data.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2))
+    result = json.loads(recognizer.FinalResult())
+    words = result.get("result", [])
+    confidence = sum(w.get("conf", 0) for w in words) / len(words) if words else None
+    return {"text": result.get("text", ""), "confidence": confidence}
+
+BACKENDS = {
+    "google": _recognize_google,
+    "vosk": _recognize_vosk,
+    "sphinx": _recognize_sphinx,
+}
+
+# Pick the backend: "auto" prefers the offline Vosk engine when it's installed
+# and a local model is configured (VOSK_MODEL_PATH)
+def resolve_backend(name=None):
+    name = name or DEFAULT_BACKEND
+    if name == "auto":
+        name = "google"
+        if VOSK_MODEL_PATH:
+            try:
+                import vosk  # noqa: F401
+                name = "vosk"
+            except ImportError:
+                pass
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown transcription backend: {name}")
+    return name
+
+
+# Locate the samples of a mono 16-bit PCM WAV without copying the upload;
+# returns (memoryview, rate, width), or None when the file needs decoding
+def wav_pcm_view(buffer):
+    view = memoryview(buffer).cast("B")
+    if len(view) < 12 or view[0:4] != b"RIFF" or view[8:12] != b"WAVE":
+        return None
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = view[offset:offset + 4].tobytes()
+        size = struct.unpack_from("<I", view, offset + 4)[0]
+        body = offset + 8
+        if chunk_id == b"fmt " and size >= 16:
+            audio_format, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", view, body)
+            fmt = (audio_format, channels, rate, bits)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            audio_format, channels, rate, bits = fmt
+            if audio_format != 1 or channels != 1 or bits != 16 or not MIN_WAV_RATE <= rate <= MAX_WAV_RATE:
+                return None
+            # Streamed WAVs may declare a bogus data size, so clamp to the buffer
+            end = min(len(view), body + size)
+            end -= (end - body) % 2
+            return view[body:end], rate, 2
+        offset = body + size + (size & 1)
+    return None
+
+def _view_blocks(pcm, block_bytes):
+    for offset in range(0, len(pcm), block_bytes):
+        yield pcm[offset:offset + block_bytes]
+
+# Decode any format with ffmpeg, streaming mono 16 kHz PCM blocks from its
+# stdout while a feeder thread writes the upload into its stdin
+def _ffmpeg_blocks(buffer, block_bytes):
+    view = memoryview(buffer).cast("B")
+    proc = subprocess.Popen(
+        [FFMPEG, "-nostdin", "-loglevel", "error", "-i", "pipe:0",
+         "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "pipe:1"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+
+    def feed():
+        try:
+            for offset in range(0, len(view), 64 * 1024):
+                proc.stdin.write(view[offset:offset + 64 * 1024])
+        except (BrokenPipeError, ValueError):
+            pass
+        finally:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+    # Drained on its own thread so a flood of decode errors can't fill the
+    # pipe and stall ffmpeg; only the tail is kept for the error message
+    error_tail = bytearray()
+
+    def drain_errors():
+        for line in proc.stderr:
+            error_tail.extend(line)
+            del error_tail[:-FFMPEG_ERROR_BYTES]
+
+    feeder = threading.Thread(target=feed, name="ffmpeg-feed", daemon=True)
+    feeder.start()
+    drainer = threading.Thread(target=drain_errors, name="ffmpeg-stderr", daemon=True)
+    drainer.start()
+    produced = False
+    finished = False
+    try:
+        while True:
+            block = proc.stdout.read(block_bytes)
+            if not block:
+                break
+            produced = True
+            yield block
+        finished = True
+    finally:
+        if not finished:
+            # Closed early (e.g. a recognizer failed): stop decoding
+            proc.kill()
+        proc.wait()
+        feeder.join()
+        drainer.join()
+        error = error_tail.decode("utf-8", "replace").strip()
+        proc.stdout.close()
+        proc.stderr.close()
+    if not produced and proc.returncode:
+        raise RuntimeError(f"ffmpeg could not decode the audio: {error}")
+
+# Streaming silence splitter: takes PCM blocks and emits speech chunks cut
+# at pauses (once at least MIN_CHUNK_MS long) or at MAX_CHUNK_MS
+class SpeechChunker:
+    def __init__(self, rate, width):
+        self.rate = rate
+        self.width = width
+        self.frame_bytes = rate * width * FRAME_MS // 1000
+        self.threshold = (2 ** (8 * width - 1)) * 10 ** (SILENCE_THRESH_DBFS / 20)
+        self._padding_bytes = self.frame_bytes * (CHUNK_PADDING_MS // FRAME_MS)
+        self._chunk = bytearray()
+        self._pending = b""
+        self._has_speech = False
+        self._silent_ms = 0
+
+    def feed(self, block):
+        view = memoryview(block)
+        if self._pending:
+            # Only when a block isn't frame aligned (e.g. the last ffmpeg read)
+            view = memoryview(self._pending + view.tobytes())
+        usable = len(view) - len(view) % self.frame_bytes
+        self._pending = view[usable:].tobytes()
+        chunks = []
+        for offset in range(0, usable, self.frame_bytes):
+            frame = view[offset:offset + self.frame_bytes]
+            chunk = self._add_frame(frame, audioop.rms(frame, self.width) >= self.threshold)
+            if chunk:
+                chunks.append(chunk)
+        return chunks
+
+    def flush(self):
+        chunk = bytes(self._chunk) if self._has_speech else None
+        self._chunk = bytearray()
+        self._has_speech = False
+        self._silent_ms = 0
+        return chunk
+
+    def _add_frame(self, frame, loud):
+        self._chunk += frame
+        if loud:
+            self._has_speech = True
+            self._silent_ms = 0
+        else:
+            self._silent_ms += FRAME_MS
+            if not self._has_speech and len(self._chunk) > self._padding_bytes:
+                # Leading silence: keep only a little padding before speech
+                del self._chunk[:len(self._chunk) - self._padding_bytes]
+        chunk_ms = len(self._chunk) * 1000 // (self.rate * self.width)
+        if chunk_ms >= MAX_CHUNK_MS or (
+            self._has_speech and self._silent_ms >= MIN_SILENCE_MS and chunk_ms >= MIN_CHUNK_MS
+        ):
+            return self.flush()
+        return None
+
+# Speech chunks of an upload: mono 16-bit WAV is read straight from the
+# upload buffer, anything else is streamed through ffmpeg
+def speech_chunks(buffer):
+    wav = wav_pcm_view(buffer)
+    if wav:
+        pcm, rate, width = wav
+        blocks = _view_blocks(pcm, rate * width * BLOCK_MS // 1000)
+    else:
+        rate, width = SAMPLE_RATE, 2
+        blocks = _ffmpeg_blocks(buffer, rate * width * BLOCK_MS // 1000)
+    chunker = SpeechChunker(rate, width)
+    for block in blocks:
+        for chunk in chunker.feed(block):
+            yield sr.AudioData(chunk, rate, width)
+    last = chunker.flush()
+    if last:
+        yield sr.AudioData(last, rate, width)
+
+# Transcribe an upload (bytes or memoryview) chunk by chunk on the shared
+# worker pool. Decoding stops while WORKERS * 2 chunks are in flight, so
+# memory stays flat for long uploads; `on_partial` receives the transcript
+# of the contiguous finished prefix as it grows.
+def transcribe(buffer, backend=None, on_partial=None):
+    recognize = BACKENDS[resolve_backend(backend)]
+    chunks = speech_chunks(buffer)
+    results = []
+    emitted = 0
+    in_flight = {}
+    exhausted = False
+    try:
+        while not exhausted or in_flight:
+            while not exhausted and len(in_flight) < WORKERS * 2:
+                audio_data = next(chunks, None)
+                if audio_data is None:
+                    exhausted = True
+                    break
+                in_flight[_executor.submit(recognize, audio_data)] = len(results)
+                results.append(None)
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                try:
+                    results[index] = future.result()
+                except sr.UnknownValueError:
+                    results[index] = {"text": "", "confidence": None}
+            if on_partial:
+                while emitted < len(results) and results[emitted] is not None:
+                    emitted += 1
+                on_partial(_join(results[:emitted]))
+    finally:
+        chunks.close()
+    return {"text": _join(results), "confidence": _mean_confidence(results), "language": LANGUAGE}
+
+def _join(results):
+    return " ".join(r["text"] for r in results if r and r["text"]).strip()
+
+def _mean_confidence(results):
+    scores = [r["confidence"] for r in results if r and r["confidence"] is not None]
+    return sum(scores) / len(scores) if scores else None
+
+
+# Content hash of an upload, computed straight from its buffer
+def audio_digest(buffer):
+    return hashlib.sha256(memoryview(buffer)).hexdigest()
+
+
+# Transcripts keyed by audio hash and language: a small in-memory LRU in
+# front of a SQLite table that evicts its least recently used rows
+class TranscriptCache:
+    def __init__(self, db_name="transcripts.sqlite3", memory_entries=CACHE_MEMORY_ENTRIES,
+                 disk_entries=CACHE_DISK_ENTRIES):
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = connect(db_name)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            " key TEXT PRIMARY KEY, text TEXT NOT NULL, language TEXT, confidence REAL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS transcripts_last_used ON transcripts (last_used)")
+        self._conn.commit()
+
+    def get(self, key):
+        with self._lock:
+            result = self._memory.get(key)
+            if result is None:
+                row = self._conn.execute(
+                    "SELECT text, language, confidence FROM transcripts WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                result = dict(row)
+                self._remember(key, result)
+            else:
+                self._memory.move_to_end(key)
+            self._conn.execute("UPDATE transcripts SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            return dict(result)
+
+    def put(self, key, result):
+        record = {"text": result["text"], "language": result.get("language"), "confidence": result.get("confidence")}
+        with self._lock:
+            self._remember(key, record)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcripts (key, text, language, confidence, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, record["text"], record["language"], record["confidence"], time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM transcripts WHERE key NOT IN"
+                " (SELECT key FROM transcripts ORDER BY last_used DESC LIMIT ?)",
+                (self.disk_entries,),
+            )
+            self._conn.commit()
+
+    def _remember(self, key, record):
+        self._memory[key] = record
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TranscriptCache()
+    return _cache
+
+# Transcribe an upload unless the same audio has been transcribed before;
+# the result carries "cached": True when no recognition was needed
+def transcribe_cached(buffer, backend=None, on_partial=None):
+    # Engines transcribe differently, so results are cached per backend
+    key = f"{audio_digest(buffer)}:{resolve_backend(backend)}:{LANGUAGE}"
+    cache = get_cache()
+    result = cache.get(key)
+    if result is not None:
+        result["cached"] = True
+        return result
+    result = transcribe(buffer, backend=backend, on_partial=on_partial)
+    if result["text"]:
+        cache.put(key, result)
+    result["cached"] = False
+    return result
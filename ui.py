@@ -0,0 +1,65 @@
+import os
+import time
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+import animations
+
+# UI helpers shared by the pages. This module is imported once per process,
+# so anything tied to one script run lives in st.session_state.
+
+# How long the end of a run may wait for pending animations
+LOTTIE_WAIT_SECONDS = float(os.getenv("LOTTIE_WAIT_SECONDS", "3"))
+
+# Animations requested during this script run, kept in the session (this
+# module is shared by every session); main() resets the list on each run
+def begin_run():
+    st.session_state._pending_lotties = []
+
+# Reserve a spot for an animation and start fetching it in the background.
+# The static performance profile skips animations entirely.
+def lottie_slot(url, height, key):
+    if st.session_state.get("perf_profile") == "static":
+        return
+    placeholder = st.empty()
+    st.session_state.setdefault("_pending_lotties", []).append((placeholder, animations.load_async(url), height, key))
+
+# Fill the reserved spots once the page body has been rendered
+def render_pending_lotties(timeout=LOTTIE_WAIT_SECONDS):
+    pending = st.session_state.get("_pending_lotties")
+    if not pending:
+        return
+    from streamlit_lottie import st_lottie
+
+    deadline = time.monotonic() + timeout
+    while pending:
+        placeholder, future, height, key = pending.pop(0)
+        try:
+            lottie_data = future.result(timeout=max(0, deadline - time.monotonic()))
+        except Exception:
+            continue
+        if lottie_data:
+            with placeholder:
+                st_lottie(lottie_data, height=height, key=key)
+
+# Switch to another page. The navigation radio hasn't been created yet on
+# the next run, so main() can still set it there.
+def navigate_to(page):
+    st.session_state._navigate_to = page
+    st.rerun()
+
+# Calculate progress for timer reminders
+def calculate_progress(start_time, total_duration):
+    if start_time is None:
+        return 0, "Login Required"
+    elapsed_time = datetime.now() - start_time
+    remaining_time = total_duration - elapsed_time.total_seconds()
+    if remaining_time <= 0:
+        return 100, "Time to water/fertilize!"
+    progress = (elapsed_time.total_seconds() / total_duration) * 100
+    return min(progress, 100), f"Time left: {timedelta(seconds=int(remaining_time))}"
+
+# Format datetime for forum posts
+def format_datetime(dt):
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,174 @@
+import json
+import os
+import random
+import threading
+import time
+import uuid
+
+import order_store
+from storage import connect
+
+BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "50"))
+BASE_BACKOFF = 2.0
+MAX_BACKOFF = float(os.getenv("OUTBOX_MAX_BACKOFF", "300"))
+POLL_SECONDS = 5.0
+
+
+# Rows become plain upserts; a conflict on idempotency_key means an earlier
+# attempt already landed, so redelivery is harmless
+def _send_rows(gateway, table, jobs):
+    rows = [dict(payload, idempotency_key=key) for key, payload in jobs]
+    gateway.table(table).upsert(rows, on_conflict="idempotency_key", ignore_duplicates=True).execute()
+
+# Orders are {"order": {...}, "items": [...]}, each placed with its items
+# in one transactional round trip
+def _send_orders(gateway, table, jobs):
+    for key, payload in jobs:
+        order_store.place_order(gateway, payload["order"], payload["items"], key)
+
+SENDERS = {"orders": _send_orders}
+
+
+# Durable write-ahead queue for Supabase inserts. Submitting is a local
+# SQLite commit; a background worker delivers queued rows in per-table
+# batches and retries failures with exponential backoff. Delivery is at
+# least once, deduplicated on each job's idempotency key.
+class WriteQueue:
+    def __init__(self, db_name="outbox.sqlite3"):
+        self._conn = connect(db_name)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker = None
+        with self._lock:
+            # Queued writes must survive a crash, so sync every commit
+            self._conn.execute("PRAGMA synchronous=FULL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    table_name TEXT NOT NULL,
+                    idempotency_key TEXT NOT NULL UNIQUE,
+                    payload TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    last_error TEXT,
+                    created_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS outbox_due ON outbox (next_attempt_at, id);
+                """
+            )
+            self._conn.commit()
+
+    # Queue a write and return its idempotency key. Enqueueing the same key
+    # twice keeps the first job.
+    def enqueue(self, table, payload, idempotency_key=None):
+        key = idempotency_key or uuid.uuid4().hex
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO outbox (table_name, idempotency_key, payload, next_attempt_at, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (table, key, json.dumps(payload), now, now),
+            )
+        self._wake.set()
+        return key
+
+    def is_pending(self, idempotency_key):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM outbox WHERE idempotency_key = ?", (idempotency_key,)
+            ).fetchone() is not None
+
+    def stats(self):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(attempts > 0), 0), MIN(created_at) FROM outbox"
+            ).fetchone()
+        return {"pending": row[0], "retrying": row[1], "oldest": row[2]}
+
+    # Deliver the jobs that are due, at most BATCH_SIZE; returns how many were sent
+    def drain_once(self, gateway):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, table_name, idempotency_key, payload, attempts FROM outbox"
+                " WHERE next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (time.time(), BATCH_SIZE),
+            ).fetchall()
+        by_table = {}
+        for row in rows:
+            by_table.setdefault(row["table_name"], []).append(row)
+        sent = 0
+        for table, batch in by_table.items():
+            try:
+                self._send(gateway, table, batch)
+                sent += len(batch)
+            except Exception:
+                # Send one by one so a single bad row can't hold back the rest
+                for row in batch:
+                    try:
+                        self._send(gateway, table, [row])
+                        sent += 1
+                    except Exception as e:
+                        self._retry_later(row, e)
+        return sent
+
+    def _send(self, gateway, table, rows):
+        sender = SENDERS.get(table, _send_rows)
+        sender(gateway, table, [(row["idempotency_key"], json.loads(row["payload"])) for row in rows])
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM outbox WHERE id = ?", [(row["id"],) for row in rows])
+
+    def _retry_later(self, row, error):
+        delay = min(MAX_BACKOFF, BASE_BACKOFF * 2 ** row["attempts"]) * random.uniform(0.5, 1.0)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET attempts = attempts + 1, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                (time.time() + delay, str(error)[:500], row["id"]),
+            )
+
+    def _seconds_until_due(self):
+        with self._lock:
+            next_at = self._conn.execute("SELECT MIN(next_attempt_at) FROM outbox").fetchone()[0]
+        if next_at is None:
+            return POLL_SECONDS
+        return min(POLL_SECONDS, max(0.0, next_at - time.time()))
+
+    # Start the delivery thread once per process. `gateway_factory` returns
+    # the Supabase gateway to write through (None while it's unavailable).
+    def start(self, gateway_factory):
+        if self._worker is not None:
+            return
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(
+                target=self._run, args=(gateway_factory,), name="write-queue", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self, gateway_factory):
+        while True:
+            try:
+                gateway = gateway_factory()
+                sent = self.drain_once(gateway) if gateway is not None else None
+            except Exception:
+                sent = None
+            if sent is None:
+                # Supabase unavailable: check again after the poll interval
+                time.sleep(POLL_SECONDS)
+            elif sent < BATCH_SIZE:
+                self._wake.wait(self._seconds_until_due())
+                self._wake.clear()
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+# Write queue shared by every session in the process
+def get_queue():
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = WriteQueue()
+    return _queue